@@ -1,7 +1,17 @@
 """Tests for yt_scribe.bundle — filesystem tests using tmp_path."""
+import json
+import os
+import re
 from pathlib import Path
 
-from yt_scribe.bundle import slugify, create_bundle_dir, generate_index, read_bundle_entries
+import pytest
+
+from yt_scribe import bundle
+from yt_scribe.bundle import (
+    slugify, create_bundle_dir, bundle_has_files, generate_index, read_bundle_entries,
+    _parse_frontmatter,
+)
+from yt_scribe.errors import BundleWriteError
 
 
 class TestSlugify:
@@ -32,6 +42,43 @@ class TestSlugify:
     def test_all_special_chars(self):
         assert slugify("!@#$%^&*()") == ""
 
+    def test_non_ascii_replaced(self):
+        assert slugify("Café Müller") == "caf_m_ller"
+
+
+class TestParseFrontmatter:
+    """Test _parse_frontmatter() key/value extraction."""
+
+    def test_strips_quotes(self):
+        fm = _parse_frontmatter('---\ntitle: "Quoted"\nchannel: \'Single\'\ncount: 3\n---\n')
+        assert fm == {"title": "Quoted", "channel": "Single", "count": "3"}
+
+    def test_value_containing_colon(self):
+        fm = _parse_frontmatter('---\ntitle: "Part 1: Intro"\nurl: "https://youtu.be/x"\n---\n')
+        assert fm["title"] == "Part 1: Intro"
+        assert fm["url"] == "https://youtu.be/x"
+
+    def test_ignores_body(self):
+        fm = _parse_frontmatter('---\ntitle: "T"\n---\n\nbody: not frontmatter\n---\n')
+        assert fm == {"title": "T"}
+
+    def test_no_frontmatter(self):
+        assert _parse_frontmatter("# Just a heading\n") == {}
+
+    def test_unterminated_frontmatter(self):
+        assert _parse_frontmatter('---\ntitle: "T"\n') == {}
+
+    def test_nested_frontmatter_uses_yaml(self):
+        pytest.importorskip("yaml")
+        fm = _parse_frontmatter(
+            '---\ntitle: "Nested"\ntags:\n  - a\n  - b\nvideo_id: abc12345678\n---\n'
+        )
+        assert fm == {"title": "Nested", "video_id": "abc12345678"}
+
+    def test_invalid_yaml_keeps_flat_lines(self):
+        fm = _parse_frontmatter('---\ntitle: "T"\n  bad: [unclosed\n---\n')
+        assert fm["title"] == "T"
+
 
 class TestCreateBundleDir:
     """Test create_bundle_dir() with tmp directories."""
@@ -59,6 +106,28 @@ class TestCreateBundleDir:
         assert bundle_dir == Path("transcripts") / "test_bundle"
         assert bundle_dir.exists()
 
+    def test_leaves_no_probe_file(self, tmp_path):
+        bundle_dir = create_bundle_dir("test_bundle", output_base=tmp_path)
+        assert list(bundle_dir.iterdir()) == []
+
+    def test_unwritable_base_raises(self, tmp_path):
+        base = tmp_path / "not_a_dir"
+        base.write_text("", encoding="utf-8")
+        with pytest.raises(BundleWriteError, match="Cannot write to bundle directory"):
+            create_bundle_dir("test_bundle", output_base=base)
+
+
+class TestBundleHasFiles:
+    """Test bundle_has_files() on fresh and populated bundles."""
+
+    def test_fresh_bundle_is_empty(self, tmp_path):
+        assert not bundle_has_files(create_bundle_dir("b", output_base=tmp_path))
+
+    def test_existing_file(self, tmp_path):
+        bundle_dir = create_bundle_dir("b", output_base=tmp_path)
+        (bundle_dir / "old.md").write_text("", encoding="utf-8")
+        assert bundle_has_files(bundle_dir)
+
 
 class TestGenerateIndex:
     """Test generate_index() output."""
@@ -121,6 +190,14 @@ class TestGenerateIndex:
         assert "First Video" in content
         assert "vid11111111" in content
 
+    def test_created_at_format(self, tmp_path):
+        bundle_dir = tmp_path / "test_bundle"
+        bundle_dir.mkdir()
+
+        index_path = generate_index(bundle_dir, "bundle", "query", [], rescan=False)
+        content = index_path.read_text(encoding="utf-8")
+        assert re.search(r'created_at: "\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} UTC"', content)
+
     def test_index_with_source_url(self, tmp_path):
         bundle_dir = tmp_path / "test_bundle"
         bundle_dir.mkdir()
@@ -138,6 +215,124 @@ class TestGenerateIndex:
         content = index_path.read_text(encoding="utf-8")
         assert 'source_url: "https://youtube.com/playlist?list=PL123"' in content
 
+    def test_no_rescan_uses_saved_files_only(self, tmp_path):
+        bundle_dir = tmp_path / "test_bundle"
+        bundle_dir.mkdir()
+        (bundle_dir / "unlisted.md").write_text(
+            '---\ntitle: "Unlisted"\nvideo_id: "vid99999999"\n---\n',
+            encoding="utf-8",
+        )
+
+        saved_files = [("Video", "vid12345678", bundle_dir / "video.md")]
+        index_path = generate_index(
+            bundle_dir, "bundle", "query", saved_files, rescan=False,
+        )
+        content = index_path.read_text(encoding="utf-8")
+        assert "count: 1" in content
+        assert "Unlisted" not in content
+
+    def test_no_rescan_dedupes_repeated_file(self, tmp_path):
+        bundle_dir = tmp_path / "test_bundle"
+        bundle_dir.mkdir()
+        entry = ("Video", "vid12345678", bundle_dir / "video.md")
+        index_path = generate_index(
+            bundle_dir, "bundle", "query", [entry, entry], rescan=False,
+        )
+        content = index_path.read_text(encoding="utf-8")
+        assert "count: 1" in content
+        assert content.count("](./video.md)") == 1
+
+    def test_writes_manifest(self, tmp_path):
+        bundle_dir = tmp_path / "test_bundle"
+        bundle_dir.mkdir()
+        path = bundle_dir / "video.md"
+        path.write_text('---\ntitle: "Video"\nvideo_id: "vid12345678"\n---\n', encoding="utf-8")
+
+        generate_index(bundle_dir, "bundle", "query", [("Video", "vid12345678", path)])
+        assert (bundle_dir / "_bundle.json").is_file()
+
+    def test_writes_index_json(self, tmp_path):
+        bundle_dir = tmp_path / "test_bundle"
+        bundle_dir.mkdir()
+        path = bundle_dir / "video.md"
+        path.write_text('---\ntitle: "Video"\nvideo_id: "vid12345678"\n---\n', encoding="utf-8")
+
+        generate_index(bundle_dir, "bundle", "query", [("Video", "vid12345678", path)])
+        data = json.loads((bundle_dir / "_index.json").read_text(encoding="utf-8"))
+        assert data["count"] == 1
+        assert data["entries"] == [{
+            "title": "Video",
+            "video_id": "vid12345678",
+            "filename": "video.md",
+            "url": "https://youtube.com/watch?v=vid12345678",
+        }]
+
+    def test_large_bundle_table_capped(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bundle, "INDEX_TABLE_MAX_ROWS", 2)
+        bundle_dir = tmp_path / "test_bundle"
+        bundle_dir.mkdir()
+        saved_files = [(f"Video {n}", f"vid{n:08d}", bundle_dir / f"v{n}.md") for n in range(3)]
+
+        index_path = generate_index(bundle_dir, "bundle", "query", saved_files, rescan=False)
+        content = index_path.read_text(encoding="utf-8")
+        assert "count: 3" in content
+        assert "Video 1" in content
+        assert "Video 2" not in content
+        assert "_index.json" in content
+        data = json.loads((bundle_dir / "_index.json").read_text(encoding="utf-8"))
+        assert len(data["entries"]) == 3
+
+
+class TestManifest:
+    """Test that read_bundle_entries() trusts an up-to-date manifest."""
+
+    def _make_bundle(self, tmp_path):
+        bundle_dir = tmp_path / "bundle"
+        bundle_dir.mkdir()
+        path = bundle_dir / "video.md"
+        path.write_text('---\ntitle: "Alpha"\nvideo_id: "vid12345678"\n---\n', encoding="utf-8")
+        generate_index(bundle_dir, "bundle", "query", [("Alpha", "vid12345678", path)])
+        return bundle_dir, path
+
+    def test_unchanged_file_served_from_manifest(self, tmp_path):
+        bundle_dir, path = self._make_bundle(tmp_path)
+        st = path.stat()
+        # Same size and mtime: the manifest entry stays authoritative
+        path.write_text('---\ntitle: "Bravo"\nvideo_id: "vid12345678"\n---\n', encoding="utf-8")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert read_bundle_entries(bundle_dir)[0][0] == "Alpha"
+
+    def test_changed_file_reparsed(self, tmp_path):
+        bundle_dir, path = self._make_bundle(tmp_path)
+        path.write_text('---\ntitle: "Renamed video"\nvideo_id: "vid12345678"\n---\n', encoding="utf-8")
+
+        assert read_bundle_entries(bundle_dir)[0][0] == "Renamed video"
+
+    def test_corrupt_manifest_ignored(self, tmp_path):
+        bundle_dir, path = self._make_bundle(tmp_path)
+        (bundle_dir / "_bundle.json").write_text("{not json", encoding="utf-8")
+
+        assert read_bundle_entries(bundle_dir)[0][0] == "Alpha"
+
+
+    @pytest.mark.parametrize("record", [
+        {"title": "Alpha", "video_id": "vid12345678"},
+        [1, 2],
+        None,
+        "video",
+    ])
+    def test_damaged_record_reparsed(self, tmp_path, record):
+        bundle_dir, path = self._make_bundle(tmp_path)
+        (bundle_dir / "_bundle.json").write_text(
+            json.dumps({"version": 1, "files": {"video.md": record}}), encoding="utf-8",
+        )
+        path.write_text('---\ntitle: "Bravo"\nvideo_id: "vid12345678"\n---\n', encoding="utf-8")
+
+        assert read_bundle_entries(bundle_dir)[0][0] == "Bravo"
+        generate_index(bundle_dir, "bundle", "query", [], rescan=True)
+        assert "Bravo" in (bundle_dir / "_index.md").read_text(encoding="utf-8")
+
 
 class TestReadBundleEntries:
     """Test read_bundle_entries() file scanning."""
@@ -168,6 +363,55 @@ class TestReadBundleEntries:
         entries = read_bundle_entries(tmp_path)
         assert len(entries) == 1
 
+    def test_skips_non_markdown_and_directories(self, tmp_path):
+        (tmp_path / "notes.txt").write_text("not markdown", encoding="utf-8")
+        (tmp_path / "folder.md").mkdir()
+        (tmp_path / "video.md").write_text(
+            '---\ntitle: "Video"\nvideo_id: "id123456789"\n---\n',
+            encoding="utf-8",
+        )
+
+        entries = read_bundle_entries(tmp_path)
+        assert [e[2].name for e in entries] == ["video.md"]
+
+    def test_many_files_keep_filename_order(self, tmp_path):
+        for n in range(40):
+            (tmp_path / f"video{n:02d}.md").write_text(
+                f'---\ntitle: "Video {n}"\nvideo_id: "id{n:09d}"\n---\n',
+                encoding="utf-8",
+            )
+
+        entries = read_bundle_entries(tmp_path)
+        assert [e[0] for e in entries] == [f"Video {n}" for n in range(40)]
+
+    def test_falls_back_to_stem_without_frontmatter(self, tmp_path):
+        (tmp_path / "plain_note.md").write_text("# Heading\n\n---\n", encoding="utf-8")
+
+        entries = read_bundle_entries(tmp_path)
+        assert entries == [("plain_note", "", tmp_path / "plain_note.md")]
+
     def test_empty_dir(self, tmp_path):
         entries = read_bundle_entries(tmp_path)
         assert entries == []
+
+    def test_known_entries_not_reread(self, tmp_path):
+        (tmp_path / "video.md").write_text("no frontmatter here", encoding="utf-8")
+        (tmp_path / "other.md").write_text(
+            '---\ntitle: "Other"\nvideo_id: "id222222222"\n---\n',
+            encoding="utf-8",
+        )
+
+        known = [("Known Title", "id111111111", tmp_path / "video.md")]
+        entries = read_bundle_entries(tmp_path, known=known)
+        assert entries == [
+            ("Other", "id222222222", tmp_path / "other.md"),
+            ("Known Title", "id111111111", tmp_path / "video.md"),
+        ]
+
+    def test_picks_up_edited_file(self, tmp_path):
+        md = tmp_path / "video.md"
+        md.write_text('---\ntitle: "Before"\nvideo_id: "id111111111"\n---\n', encoding="utf-8")
+        assert read_bundle_entries(tmp_path)[0][0] == "Before"
+
+        md.write_text('---\ntitle: "After edit"\nvideo_id: "id111111111"\n---\n', encoding="utf-8")
+        assert read_bundle_entries(tmp_path)[0][0] == "After edit"
@@ -0,0 +1,146 @@
+"""Tests for yt_scribe.cache — mocked fetchers, cache in a temp directory."""
+import json
+import os
+import time
+
+import pytest
+
+from yt_scribe import cache
+from yt_scribe.errors import TranscriptNotAvailableError
+from yt_scribe.metadata import VideoMetadata
+from yt_scribe.transcript import TranscriptSegment, TranscriptResult
+
+
+@pytest.fixture
+def calls(tmp_path, monkeypatch):
+    """Point the cache at tmp_path and count calls to the real fetchers."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    counts = {"metadata": 0, "transcript": 0}
+
+    def fetch_metadata(video_id, enrich=False):
+        counts["metadata"] += 1
+        return VideoMetadata(
+            video_id=video_id, title="Title", channel="Chan",
+            duration_seconds=90, source="yt-dlp" if enrich else "oembed",
+        )
+
+    def fetch_transcript(video_id, languages=None):
+        counts["transcript"] += 1
+        if video_id == "missing0000":
+            raise TranscriptNotAvailableError("No transcripts")
+        return TranscriptResult(
+            video_id=video_id, language="English", language_code="en", is_generated=True,
+            segments=[TranscriptSegment(text="hi", start=0.0, duration=2.0)],
+        )
+
+    monkeypatch.setattr("yt_scribe.metadata.fetch_metadata", fetch_metadata)
+    monkeypatch.setattr("yt_scribe.transcript.fetch_transcript", fetch_transcript)
+    return counts
+
+
+class TestCacheDir:
+    def test_honours_xdg_cache_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert cache.cache_dir() == tmp_path / "yt-scribe"
+
+    def test_defaults_to_home(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert cache.cache_dir() == tmp_path / ".cache" / "yt-scribe"
+
+
+class TestFetchMetadataCached:
+    def test_second_call_hits_cache(self, calls):
+        first = cache.fetch_metadata_cached("abc12345678", enrich=True)
+        second = cache.fetch_metadata_cached("abc12345678", enrich=True)
+        assert calls["metadata"] == 1
+        assert second == first
+
+    def test_enrich_is_part_of_key(self, calls):
+        cache.fetch_metadata_cached("abc12345678", enrich=True)
+        cache.fetch_metadata_cached("abc12345678", enrich=False)
+        assert calls["metadata"] == 2
+
+    def test_oembed_fallback_not_cached(self, calls, monkeypatch):
+        monkeypatch.setattr(
+            "yt_scribe.metadata.fetch_metadata",
+            lambda video_id, enrich=False: VideoMetadata(video_id=video_id, title="T", channel="C"),
+        )
+        cache.fetch_metadata_cached("abc12345678", enrich=True)
+        assert not (cache.cache_dir() / "metadata").exists()
+
+    def test_stale_entry_refetched(self, calls):
+        cache.fetch_metadata_cached("abc12345678")
+        [entry] = (cache.cache_dir() / "metadata").iterdir()
+        old = time.time() - cache.METADATA_TTL_SECONDS - 60
+        os.utime(entry, (old, old))
+        cache.fetch_metadata_cached("abc12345678")
+        assert calls["metadata"] == 2
+
+    def test_corrupt_entry_is_a_miss(self, calls):
+        cache.fetch_metadata_cached("abc12345678")
+        [entry] = (cache.cache_dir() / "metadata").iterdir()
+        entry.write_text("{not json", encoding="utf-8")
+        meta = cache.fetch_metadata_cached("abc12345678")
+        assert calls["metadata"] == 2
+        assert meta.title == "Title"
+
+    def test_mismatched_fields_are_a_miss(self, calls):
+        cache.fetch_metadata_cached("abc12345678")
+        [entry] = (cache.cache_dir() / "metadata").iterdir()
+        data = json.loads(entry.read_bytes())
+        data["value"]["removed_field"] = 1
+        entry.write_text(json.dumps(data), encoding="utf-8")
+        meta = cache.fetch_metadata_cached("abc12345678")
+        assert calls["metadata"] == 2
+        assert meta.title == "Title"
+
+    def test_refresh_refetches_and_stores(self, calls):
+        cache.fetch_metadata_cached("abc12345678")
+        cache.fetch_metadata_cached("abc12345678", refresh=True)
+        cache.fetch_metadata_cached("abc12345678")
+        assert calls["metadata"] == 2
+
+
+class TestFetchTranscriptCached:
+    def test_round_trip(self, calls):
+        first = cache.fetch_transcript_cached("abc12345678", ["en"])
+        second = cache.fetch_transcript_cached("abc12345678", ["en"])
+        assert calls["transcript"] == 1
+        assert second == first
+        assert isinstance(second.segments[0], TranscriptSegment)
+
+    def test_languages_are_part_of_key(self, calls):
+        cache.fetch_transcript_cached("abc12345678", ["en"])
+        cache.fetch_transcript_cached("abc12345678", ["es", "en"])
+        assert calls["transcript"] == 2
+
+    @pytest.mark.parametrize("edit", [
+        lambda value: value.pop("language"),
+        lambda value: value.pop("segments"),
+        lambda value: value["segments"][0].update(speaker="x"),
+        lambda value: value.update(segments=[1]),
+    ])
+    def test_mismatched_fields_are_a_miss(self, calls, edit):
+        cache.fetch_transcript_cached("abc12345678")
+        [entry] = (cache.cache_dir() / "transcript").iterdir()
+        data = json.loads(entry.read_bytes())
+        edit(data["value"])
+        entry.write_text(json.dumps(data), encoding="utf-8")
+        transcript = cache.fetch_transcript_cached("abc12345678")
+        assert calls["transcript"] == 2
+        assert transcript.segments[0].text == "hi"
+
+    def test_failures_not_cached(self, calls):
+        for _ in range(2):
+            with pytest.raises(TranscriptNotAvailableError):
+                cache.fetch_transcript_cached("missing0000")
+        assert calls["transcript"] == 2
+
+    def test_outlives_metadata_ttl(self, calls):
+        cache.fetch_transcript_cached("abc12345678")
+        [entry] = (cache.cache_dir() / "transcript").iterdir()
+        old = time.time() - cache.METADATA_TTL_SECONDS - 60
+        os.utime(entry, (old, old))
+        cache.fetch_transcript_cached("abc12345678")
+        assert calls["transcript"] == 1
@@ -1,7 +1,22 @@
-"""Tests for CLI utility functions — pure logic, no mocks needed."""
+"""Tests for CLI utility functions, plus batch runs with mocked fetching."""
+import json
+import os
+import subprocess
+import sys
+import threading
+
 import pytest
 
-from yt_scribe.cli import parse_selection, _format_duration_short
+from yt_scribe.cli import (
+    parse_selection, _format_duration_short, _parse_batch_args, build_batch_parser,
+    batch_main, main, search_main, _json_bytes, _display_results, _jsonl_write,
+)
+from yt_scribe.search import SearchResult
+from yt_scribe import cli
+from yt_scribe import transcript as transcript_module
+from yt_scribe.errors import TranscriptNotAvailableError
+from yt_scribe.metadata import VideoMetadata
+from yt_scribe.transcript import TranscriptSegment, TranscriptResult
 
 
 class TestParseSelection:
@@ -28,6 +43,9 @@ class TestParseSelection:
     def test_deduplication(self):
         assert parse_selection("1,1,2,2", 5) == [1, 2]
 
+    def test_overlapping_ranges_keep_first_order(self):
+        assert parse_selection("4-6,1-5,6", 10) == [4, 5, 6, 1, 2, 3]
+
     def test_preserves_order(self):
         assert parse_selection("5,3,1", 5) == [5, 3, 1]
 
@@ -83,3 +101,331 @@ class TestFormatDurationShort:
         assert _format_duration_short(65.9) == " 1:05"
 
 
+class TestParseBatchArgs:
+    """Test _parse_batch_args() against the argparse batch parser."""
+
+    @pytest.mark.parametrize("argv", [
+        ["--bundle", "b", "id1", "id2"],
+        ["id1", "id2", "--bundle", "b"],
+        ["--bundle=b", "--jsonl", "id1"],
+        ["--bundle", "b", "-o", "out", "--from-file", "ids.txt", "--json", "-v"],
+        ["--bundle", "b", "--output=out", "-l", "en", "es"],
+        ["--bundle", "b", "--", "id1"],
+        ["--bundle", "b", "-j", "8", "id1"],
+    ])
+    def test_matches_argparse(self, argv):
+        assert _parse_batch_args(argv) == build_batch_parser().parse_args(argv)
+
+    @pytest.mark.parametrize("argv", [
+        ["--help"],
+        ["-h", "--bundle", "b"],
+        ["id1"],
+        ["--bundle"],
+        ["--bundle", "b", "--lang"],
+        ["--bund", "b"],
+        ["--bundle", "b", "--unknown"],
+        ["--bundle", "b", "-oout"],
+        ["--bundle", "b", "-j", "²", "id1"],
+        ["--bundle", "b", "--concurrency=x", "id1"],
+    ])
+    def test_defers_to_argparse(self, argv):
+        assert _parse_batch_args(argv) is None
+
+
+class TestDisplayResults:
+    """Test _display_results() table rendering."""
+
+    def test_table_layout(self, capsys):
+        _display_results([
+            SearchResult("a" * 11, "T" * 50, "Chan", 61, "u", view_count=1234, upload_date="2024-01-01"),
+            SearchResult("b" * 11, "Short", None, None, "u"),
+        ])
+        out = capsys.readouterr().out
+        lines = out.split("\n")
+        assert lines[0] == ""
+        assert lines[1].split() == ["#", "Title", "Channel", "Views", "Uploaded", "Duration"]
+        assert lines[2].split() == ["1", "T" * 42 + "...", "Chan", "1K", "2024-01-01", "1:01"]
+        assert lines[3].split() == ["2", "Short", "Unknown", "-", "-", "???"]
+        assert out.endswith("\n\n")
+
+
+class TestJsonBytes:
+    """Test _json_bytes() with and without orjson."""
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def backend(self, request, monkeypatch):
+        if request.param == "stdlib":
+            monkeypatch.setattr(cli, "orjson", None)
+        elif cli.orjson is None:
+            pytest.skip("orjson not installed")
+
+    def test_compact_utf8(self, backend):
+        assert _json_bytes({"title": "Café", "n": [1, 2]}) == '{"title":"Café","n":[1,2]}'.encode("utf-8")
+
+    def test_pretty(self, backend):
+        out = _json_bytes({"a": 1}, pretty=True)
+        assert out == b'{\n  "a": 1\n}'
+
+
+class TestJsonlWrite:
+    """Test _jsonl_write() on a real file descriptor and on a captured stream."""
+
+    def test_writes_to_file_descriptor(self, tmp_path, monkeypatch):
+        path = tmp_path / "out.jsonl"
+        with open(path, "w", encoding="utf-8") as fh:
+            monkeypatch.setattr("sys.stdout", fh)
+            _jsonl_write({"event": "start", "title": "Café"})
+            _jsonl_write({"event": "complete"})
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"event": "start", "title": "Café"},
+            {"event": "complete"},
+        ]
+
+    def test_stream_without_descriptor(self, capsys):
+        _jsonl_write({"event": "start"})
+        assert capsys.readouterr().out == '{"event":"start"}\n'
+
+
+class TestWriteStdoutBytes:
+    """Test _write_stdout_bytes() on a real file descriptor."""
+
+    def test_large_output_in_slices(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cli, "_STDOUT_CHUNK_SIZE", 7)
+        writes = []
+        real_write = cli.os.write
+
+        def write(fd, data):
+            writes.append(len(data))
+            return real_write(fd, data)
+
+        monkeypatch.setattr(cli.os, "write", write)
+        data = "Café ☕ ".encode("utf-8") * 10
+        path = tmp_path / "out.txt"
+        with open(path, "w", encoding="utf-8") as fh:
+            monkeypatch.setattr("sys.stdout", fh)
+            fh.write("before\n")
+            cli._write_stdout_bytes(data)
+        assert path.read_bytes() == b"before\n" + data
+        assert max(writes) == 7
+
+
+@pytest.fixture
+def fake_fetch(tmp_path, monkeypatch):
+    """Run CLI commands against canned metadata/transcripts in an empty home."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    def fetch_metadata(video_id, enrich=False):
+        return VideoMetadata(video_id=video_id, title=f"Title {video_id}", channel="Chan")
+
+    def fetch_transcript(video_id, languages=None):
+        if video_id.startswith("missing"):
+            raise TranscriptNotAvailableError(f"No transcripts for {video_id}")
+        return TranscriptResult(
+            video_id=video_id, language="English", language_code="en", is_generated=False,
+            segments=[TranscriptSegment(text="hello", start=0.0, duration=1.5)],
+        )
+
+    monkeypatch.setattr("yt_scribe.metadata.fetch_metadata", fetch_metadata)
+    monkeypatch.setattr("yt_scribe.transcript.fetch_transcript", fetch_transcript)
+    return tmp_path
+
+
+class TestBatchMain:
+    """Test batch_main() end to end with network calls mocked out."""
+
+    def test_json_output(self, fake_fetch, capsys):
+        rc = batch_main(["aaaaaaaaaaa", "missing0000", "--bundle", "b", "-o", str(fake_fetch), "--json"])
+        assert rc == 0
+        out = json.loads(capsys.readouterr().out)
+        assert out["total_saved"] == 1
+        assert out["total_skipped"] == 1
+        assert (fake_fetch / "b" / "Title_aaaaaaaaaaa_aaaaaaaaaaa.md").is_file()
+        assert (fake_fetch / "b" / "_index.md").is_file()
+
+    def test_jsonl_events(self, fake_fetch, capsys):
+        rc = batch_main(["aaaaaaaaaaa", "bbbbbbbbbbb", "--bundle", "b", "-o", str(fake_fetch), "--jsonl"])
+        assert rc == 0
+        events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert events[0] == {"event": "start", "total": 2, "bundle": "b"}
+        assert sorted(e["video_id"] for e in events[1:3]) == ["aaaaaaaaaaa", "bbbbbbbbbbb"]
+        assert [e["index"] for e in events[1:3]] == [1, 2]
+        assert events[-1]["event"] == "complete"
+        assert events[-1]["total_saved"] == 2
+
+    def test_invalid_video_skipped(self, fake_fetch, capsys):
+        rc = batch_main(["not a video", "--bundle", "b", "-o", str(fake_fetch), "--json"])
+        assert rc == 0
+        out = json.loads(capsys.readouterr().out)
+        assert out["files"][0]["status"] == "skipped"
+
+    def test_from_file_skips_comments_and_duplicates(self, fake_fetch, capsys):
+        listing = fake_fetch / "videos.txt"
+        listing.write_text("# research\naaaaaaaaaaa\n\nbbbbbbbbbbb\naaaaaaaaaaa\n", encoding="utf-8")
+        rc = batch_main(["bbbbbbbbbbb", "--from-file", str(listing), "--bundle", "b", "-o", str(fake_fetch), "--json"])
+        assert rc == 0
+        out = json.loads(capsys.readouterr().out)
+        assert out["total_requested"] == 2
+        assert sorted(f["video_id"] for f in out["files"]) == ["aaaaaaaaaaa", "bbbbbbbbbbb"]
+
+    def test_json_files_in_input_order(self, fake_fetch, capsys, monkeypatch):
+        # The first video finishes last, so completion order differs from input order
+        second_done = threading.Event()
+        real_fetch = transcript_module.fetch_transcript
+
+        def fetch_transcript(video_id, languages=None):
+            if video_id == "aaaaaaaaaaa":
+                second_done.wait(5)
+            result = real_fetch(video_id, languages)
+            if video_id == "bbbbbbbbbbb":
+                second_done.set()
+            return result
+
+        monkeypatch.setattr("yt_scribe.transcript.fetch_transcript", fetch_transcript)
+        rc = batch_main([
+            "aaaaaaaaaaa", "bbbbbbbbbbb", "missing0000",
+            "--bundle", "b", "-o", str(fake_fetch), "-j", "3", "--json", "--no-cache",
+        ])
+        assert rc == 0
+        out = json.loads(capsys.readouterr().out)
+        assert [f["video_id"] for f in out["files"]] == ["aaaaaaaaaaa", "bbbbbbbbbbb", "missing0000"]
+
+    def test_same_video_by_id_and_url_fetched_once(self, fake_fetch, capsys, monkeypatch):
+        fetched = []
+        real_fetch = transcript_module.fetch_transcript
+
+        def fetch_transcript(video_id, languages=None):
+            fetched.append(video_id)
+            return real_fetch(video_id, languages)
+
+        monkeypatch.setattr("yt_scribe.transcript.fetch_transcript", fetch_transcript)
+        rc = batch_main([
+            "aaaaaaaaaaa", "https://youtu.be/aaaaaaaaaaa", "aaaaaaaaaaa",
+            "--bundle", "b", "-o", str(fake_fetch), "--json", "--no-cache",
+        ])
+        assert rc == 0
+        out = json.loads(capsys.readouterr().out)
+        assert fetched == ["aaaaaaaaaaa"]
+        assert out["total_requested"] == 1
+        index = (fake_fetch / "b" / "_index.md").read_text(encoding="utf-8")
+        assert "count: 1" in index
+
+    @pytest.mark.parametrize("extra", [[], ["--json"]])
+    def test_config_warnings_reach_stderr(self, tmp_path, extra):
+        # Run in a subprocess: pytest's own log capture would hide whether
+        # the warning reaches stderr without any logging configuration
+        (tmp_path / ".yt-scribe.toml").write_text("bogus_key = 1\n", encoding="utf-8")
+        proc = subprocess.run(
+            [sys.executable, "-m", "yt_scribe.cli", "batch", "--bundle", "b", *extra],
+            cwd=tmp_path, env={**os.environ, "HOME": str(tmp_path)},
+            capture_output=True, text=True,
+        )
+        assert proc.returncode == 1
+        assert "Unknown config key 'bogus_key'" in proc.stderr
+
+    def test_missing_from_file(self, fake_fetch, capsys):
+        rc = batch_main(["--from-file", str(fake_fetch / "nope.txt"), "--bundle", "b"])
+        assert rc == 1
+        assert "File not found" in capsys.readouterr().err
+
+    def test_unwritable_output_fails_before_fetching(self, fake_fetch, capsys, monkeypatch):
+        def no_fetch(*args, **kwargs):
+            raise AssertionError("fetched despite unwritable bundle dir")
+        monkeypatch.setattr("yt_scribe.metadata.fetch_metadata", no_fetch)
+        base = fake_fetch / "file"
+        base.write_text("", encoding="utf-8")
+        rc = batch_main(["aaaaaaaaaaa", "--bundle", "b", "-o", str(base)])
+        assert rc == 1
+        assert "Cannot write to bundle directory" in capsys.readouterr().err
+
+    def test_interrupt_still_writes_index(self, fake_fetch, monkeypatch):
+        real_fetch = transcript_module.fetch_transcript
+
+        def fetch_transcript(video_id, languages=None):
+            if video_id == "interrupt00":
+                raise KeyboardInterrupt
+            return real_fetch(video_id, languages)
+
+        monkeypatch.setattr("yt_scribe.transcript.fetch_transcript", fetch_transcript)
+        rc = batch_main([
+            "aaaaaaaaaaa", "interrupt00", "--bundle", "b", "-o", str(fake_fetch), "-j", "1", "--jsonl",
+        ])
+        assert rc == 130
+        index = (fake_fetch / "b" / "_index.md").read_text(encoding="utf-8")
+        assert "count: 1" in index
+        assert "Title aaaaaaaaaaa" in index
+
+
+class TestSearchMain:
+    """Test search_main() with search, prompts and fetching mocked out."""
+
+    def test_duplicate_results_fetched_once(self, fake_fetch, capsys, monkeypatch):
+        result = SearchResult(
+            video_id="aaaaaaaaaaa", title="Title aaaaaaaaaaa", channel="Chan",
+            duration_seconds=60, url="https://www.youtube.com/watch?v=aaaaaaaaaaa",
+        )
+        monkeypatch.setattr("yt_scribe.search.search_youtube", lambda query, max_results: [result, result])
+        answers = iter(["all", "b"])
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+        fetched = []
+        real_fetch = transcript_module.fetch_transcript
+
+        def fetch_transcript(video_id, languages=None):
+            fetched.append(video_id)
+            return real_fetch(video_id, languages)
+
+        monkeypatch.setattr("yt_scribe.transcript.fetch_transcript", fetch_transcript)
+        rc = search_main(["query", "-o", str(fake_fetch), "--no-cache"])
+        assert rc == 0
+        assert fetched == ["aaaaaaaaaaa"]
+        assert "Fetching 1 transcripts" in capsys.readouterr().out
+
+
+class TestMain:
+    """Test the single-video command with network calls mocked out."""
+
+    def test_saves_markdown(self, fake_fetch, capsys):
+        rc = main(["aaaaaaaaaaa", "-o", str(fake_fetch / "out")])
+        assert rc == 0
+        saved = fake_fetch / "out" / "Title_aaaaaaaaaaa_aaaaaaaaaaa.md"
+        assert f"Saved: {saved}" in capsys.readouterr().out
+        assert "**[0:00]** hello" in saved.read_text(encoding="utf-8")
+
+    def test_json_stdout(self, fake_fetch, capsys):
+        rc = main(["aaaaaaaaaaa", "--json", "--stdout"])
+        assert rc == 0
+        data = json.loads(capsys.readouterr().out)
+        assert data["title"] == "Title aaaaaaaaaaa"
+        assert data["duration_seconds"] == 1
+
+    def test_markdown_stdout(self, fake_fetch, capsys):
+        rc = main(["aaaaaaaaaaa", "--stdout"])
+        assert rc == 0
+        out = capsys.readouterr().out
+        assert out.startswith("---\n")
+        assert "**[0:00]** hello" in out
+
+    def test_encode_batches(self, monkeypatch):
+        monkeypatch.setattr(cli, "_WRITE_BATCH_CHUNKS", 2)
+        assert list(cli._encode_batches(["a", "é", "c"])) == ["aé".encode("utf-8"), b"c"]
+        assert list(cli._encode_batches([])) == []
+
+    def test_transcript_error(self, fake_fetch, capsys):
+        rc = main(["missing0000"])
+        assert rc == 1
+        assert "No transcripts for missing0000" in capsys.readouterr().err
+
+    def test_cached_unless_refresh(self, fake_fetch, monkeypatch):
+        fetched = []
+        real_fetch = transcript_module.fetch_transcript
+
+        def fetch_transcript(video_id, languages=None):
+            fetched.append(video_id)
+            return real_fetch(video_id, languages)
+
+        monkeypatch.setattr("yt_scribe.transcript.fetch_transcript", fetch_transcript)
+        for extra in ([], [], ["--refresh"], ["--no-cache"]):
+            assert main(["aaaaaaaaaaa", "--stdout", *extra]) == 0
+        assert len(fetched) == 3
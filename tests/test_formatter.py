@@ -1,9 +1,17 @@
 """Tests for yt_scribe.formatter — pure logic, no mocks needed."""
 import json
+from datetime import datetime, timezone
+
+import pytest
 
 from yt_scribe.metadata import VideoMetadata
 from yt_scribe.transcript import TranscriptSegment, TranscriptResult
-from yt_scribe.formatter import format_markdown, format_json, generate_filename
+from yt_scribe import formatter
+from yt_scribe.formatter import (
+    format_markdown, iter_markdown, format_json, format_json_bytes, iter_json_bytes,
+    generate_filename,
+    _format_timestamp, _format_timestamps,
+)
 
 
 def _make_metadata(**overrides) -> VideoMetadata:
@@ -60,6 +68,14 @@ class TestGenerateFilename:
         meta = _make_metadata(title="Hello   World")
         assert generate_filename(meta) == "Hello_World_test123abcd"
 
+    def test_control_chars_replaced(self):
+        meta = _make_metadata(title="Tab\there\nnewline")
+        assert generate_filename(meta) == "Tab_here_newline_test123abcd"
+
+    def test_non_ascii_letters_kept(self):
+        meta = _make_metadata(title="Café: 日本語!")
+        assert generate_filename(meta) == "Café__日本語__test123abcd"
+
 
 class TestFormatMarkdown:
     """Test format_markdown() output structure."""
@@ -122,6 +138,66 @@ class TestFormatMarkdown:
         md = format_markdown(_make_metadata(), _make_transcript(is_generated=False))
         assert "manual" in md
 
+    def test_segment_layout(self):
+        md = format_markdown(_make_metadata(), _make_transcript())
+        assert md.endswith("## Transcript\n\n**[0:00]** Hello world\n\n**[0:02]** This is a test\n")
+
+
+class TestIterMarkdown:
+    """Test iter_markdown() chunking."""
+
+    def test_one_chunk_per_segment_after_header(self):
+        chunks = list(iter_markdown(_make_metadata(), _make_transcript()))
+        assert len(chunks) == 3
+        assert chunks[0].startswith("---\n")
+        assert chunks[1] == "\n**[0:00]** Hello world\n"
+
+    def test_full_document(self):
+        # Rendered by the original line-by-line formatter; guards the
+        # single-template header against drifting from it
+        meta = _make_metadata(upload_date="2024-01-01", duration_seconds=125)
+        when = datetime(2024, 5, 6, 7, 8, 9, tzinfo=timezone.utc)
+        assert "".join(iter_markdown(meta, _make_transcript(), when)) == (
+            '---\n'
+            'title: "Test Video Title"\n'
+            'channel: "Test Channel"\n'
+            'video_id: "test123abcd"\n'
+            'url: "https://www.youtube.com/watch?v=test123abcd"\n'
+            'duration: "2m 5s"\n'
+            'upload_date: "2024-01-01"\n'
+            'language: "English"\n'
+            'transcript_type: "manual"\n'
+            'fetched_at: "2024-05-06 07:08:09 UTC"\n'
+            '---\n'
+            '\n'
+            '# Test Video Title\n'
+            '\n'
+            '**Channel:** [Test Channel](https://youtube.com/@test)\n'
+            '**Duration:** 2m 5s\n'
+            '**Uploaded:** 2024-01-01\n'
+            '**Language:** English (manual)\n'
+            '\n'
+            '---\n'
+            '\n'
+            '## Transcript\n'
+            '\n'
+            '**[0:00]** Hello world\n'
+            '\n'
+            '**[0:02]** This is a test\n'
+        )
+
+    def test_fetched_at_passed_in(self):
+        when = datetime(2024, 5, 6, 7, 8, 9, tzinfo=timezone.utc)
+        md = format_markdown(_make_metadata(), _make_transcript(), fetched_at=when)
+        assert 'fetched_at: "2024-05-06 07:08:09 UTC"' in md
+        data = json.loads(format_json(_make_metadata(), _make_transcript(), fetched_at=when))
+        assert data["fetched_at"] == "2024-05-06T07:08:09+00:00"
+
+    def test_no_segments(self):
+        chunks = list(iter_markdown(_make_metadata(), _make_transcript(segments=[])))
+        assert len(chunks) == 1
+        assert chunks[0].endswith("## Transcript\n")
+
 
 class TestFormatJson:
     """Test format_json() output structure."""
@@ -161,3 +237,46 @@ class TestFormatJson:
         output = format_json(_make_metadata(), _make_transcript())
         data = json.loads(output)
         assert data["url"] == "https://www.youtube.com/watch?v=test123abcd"
+
+    def test_orjson_matches_stdlib(self, monkeypatch):
+        if formatter.orjson is None:
+            pytest.skip("orjson not installed")
+        meta = _make_metadata(title="Café ☕")
+        fast = json.loads(format_json_bytes(meta, _make_transcript()))
+        monkeypatch.setattr(formatter, "orjson", None)
+        slow_bytes = format_json_bytes(meta, _make_transcript())
+        slow = json.loads(slow_bytes)
+        fast.pop("fetched_at"), slow.pop("fetched_at")
+        assert fast == slow
+        assert "Café ☕".encode("utf-8") in slow_bytes
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("count", [0, 1, 2, 5])
+    def test_batches_match_single_dump(self, count, use_orjson, monkeypatch):
+        if not use_orjson:
+            monkeypatch.setattr(formatter, "orjson", None)
+        monkeypatch.setattr(formatter, "_JSON_BATCH_SEGMENTS", 2)
+        segments = [
+            TranscriptSegment(text=f'line "{i}"\nnext', start=i * 1.5, duration=1.5)
+            for i in range(count)
+        ]
+        when = datetime(2024, 5, 6, tzinfo=timezone.utc)
+        chunks = list(iter_json_bytes(_make_metadata(), _make_transcript(segments=segments), when))
+        data = json.loads(b"".join(chunks))
+        assert len(chunks) == (1 if not count else 2 + (count + 1) // 2)
+        assert b"".join(chunks).decode("utf-8") == json.dumps(data, indent=2, ensure_ascii=False)
+        assert [seg["text"] for seg in data["segments"]] == [seg.text for seg in segments]
+
+
+class TestFormatTimestamps:
+    """Test _format_timestamps() against the scalar _format_timestamp()."""
+
+    def test_matches_scalar(self):
+        starts = [0, 0.9, 5.5, 59.99, 60, 61.2, 599, 3599.9, 3600, 3661.5, 36000, 359999]
+        assert _format_timestamps(starts) == [_format_timestamp(s) for s in starts]
+
+    def test_formats(self):
+        assert _format_timestamps([65.4, 3725]) == ["1:05", "1:02:05"]
+
+    def test_empty(self):
+        assert _format_timestamps([]) == []
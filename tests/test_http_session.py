@@ -0,0 +1,16 @@
+"""Tests for yt_scribe.http_session — no network access."""
+import threading
+
+from yt_scribe.http_session import get_session
+
+
+class TestGetSession:
+    def test_reused_within_thread(self):
+        assert get_session() is get_session()
+
+    def test_separate_per_thread(self):
+        other = []
+        thread = threading.Thread(target=lambda: other.append(get_session()))
+        thread.start()
+        thread.join()
+        assert other[0] is not get_session()
@@ -10,10 +10,8 @@ from yt_scribe.errors import MetadataFetchError
 def _make_mock_ytdlp(entries):
     """Create a mock yt_dlp module that returns given entries from extract_info."""
     mock_module = MagicMock()
-    mock_ydl_instance = MagicMock()
+    mock_ydl_instance = mock_module.YoutubeDL.return_value
     mock_ydl_instance.extract_info.return_value = {"entries": entries}
-    mock_module.YoutubeDL.return_value.__enter__ = MagicMock(return_value=mock_ydl_instance)
-    mock_module.YoutubeDL.return_value.__exit__ = MagicMock(return_value=False)
     return mock_module
 
 
@@ -72,10 +70,8 @@ class TestSearchYoutube:
 
     def test_handles_no_info(self):
         mock_module = MagicMock()
-        mock_ydl_instance = MagicMock()
+        mock_ydl_instance = mock_module.YoutubeDL.return_value
         mock_ydl_instance.extract_info.return_value = None
-        mock_module.YoutubeDL.return_value.__enter__ = MagicMock(return_value=mock_ydl_instance)
-        mock_module.YoutubeDL.return_value.__exit__ = MagicMock(return_value=False)
 
         with patch.dict(sys.modules, {"yt_dlp": mock_module}):
             from yt_scribe.search import search_youtube
@@ -131,7 +127,7 @@ class TestFetchPlaylist:
 
     def test_returns_playlist_info(self):
         mock_module = MagicMock()
-        mock_ydl_instance = MagicMock()
+        mock_ydl_instance = mock_module.YoutubeDL.return_value
         mock_ydl_instance.extract_info.return_value = {
             "title": "My Playlist",
             "entries": [
@@ -151,8 +147,6 @@ class TestFetchPlaylist:
                 },
             ],
         }
-        mock_module.YoutubeDL.return_value.__enter__ = MagicMock(return_value=mock_ydl_instance)
-        mock_module.YoutubeDL.return_value.__exit__ = MagicMock(return_value=False)
 
         with patch.dict(sys.modules, {"yt_dlp": mock_module}):
             from yt_scribe.search import fetch_playlist
@@ -166,10 +160,8 @@ class TestFetchPlaylist:
 
     def test_empty_playlist_raises(self):
         mock_module = MagicMock()
-        mock_ydl_instance = MagicMock()
+        mock_ydl_instance = mock_module.YoutubeDL.return_value
         mock_ydl_instance.extract_info.return_value = {"entries": [None, None]}
-        mock_module.YoutubeDL.return_value.__enter__ = MagicMock(return_value=mock_ydl_instance)
-        mock_module.YoutubeDL.return_value.__exit__ = MagicMock(return_value=False)
 
         with patch.dict(sys.modules, {"yt_dlp": mock_module}):
             from yt_scribe.search import fetch_playlist
@@ -178,10 +170,8 @@ class TestFetchPlaylist:
 
     def test_no_entries_raises(self):
         mock_module = MagicMock()
-        mock_ydl_instance = MagicMock()
+        mock_ydl_instance = mock_module.YoutubeDL.return_value
         mock_ydl_instance.extract_info.return_value = None
-        mock_module.YoutubeDL.return_value.__enter__ = MagicMock(return_value=mock_ydl_instance)
-        mock_module.YoutubeDL.return_value.__exit__ = MagicMock(return_value=False)
 
         with patch.dict(sys.modules, {"yt_dlp": mock_module}):
             from yt_scribe.search import fetch_playlist
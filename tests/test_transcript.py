@@ -0,0 +1,38 @@
+"""Tests for yt_scribe.transcript — mocked youtube-transcript-api, no network."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from yt_scribe import transcript as transcript_module
+
+
+class _Fetched(list):
+    video_id = "abc12345678"
+    language = "English"
+    language_code = "en"
+    is_generated = False
+
+
+def _mock_api(monkeypatch, texts):
+    fetched = _Fetched(
+        SimpleNamespace(text=text, start=float(i), duration=1.0) for i, text in enumerate(texts)
+    )
+    api = MagicMock()
+    api.return_value.list.return_value.find_transcript.return_value.fetch.return_value = fetched
+    monkeypatch.setattr("youtube_transcript_api.YouTubeTranscriptApi", api)
+    return api
+
+
+class TestFetchTranscript:
+    """Test fetch_transcript() with a mocked API client."""
+
+    def test_unescapes_entities(self, monkeypatch):
+        _mock_api(monkeypatch, ["rock &amp; roll", "it&#39;s", "plain text"])
+        result = transcript_module.fetch_transcript("abc12345678")
+        assert [seg.text for seg in result.segments] == ["rock & roll", "it's", "plain text"]
+
+    def test_result_fields(self, monkeypatch):
+        _mock_api(monkeypatch, ["a", "b"])
+        result = transcript_module.fetch_transcript("abc12345678", languages=["en"])
+        assert result.language_code == "en"
+        assert result.segments[1].start == 1.0
+        assert result.duration_seconds == 2
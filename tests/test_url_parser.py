@@ -62,6 +62,20 @@ class TestExtractVideoId:
     def test_raw_id_with_hyphens_underscores(self):
         assert extract_video_id("a-b_c-d_e-f") == "a-b_c-d_e-f"
 
+    @pytest.mark.parametrize("value", [
+        "dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=120",
+        "http://m.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ?t=30",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+        "https://youtube.com/embed/dQw4w9WgXcQ?start=5",
+    ])
+    def test_common_forms_skip_url_parsing(self, value, monkeypatch):
+        def fail(_):
+            raise AssertionError(f"urlparse called for {value}")
+        monkeypatch.setattr("yt_scribe.url_parser.urlparse", fail)
+        assert extract_video_id(value) == "dQw4w9WgXcQ"
+
     # --- Whitespace handling ---
 
     def test_strips_whitespace(self):
@@ -89,6 +103,17 @@ class TestExtractVideoId:
         with pytest.raises(ValueError):
             extract_video_id("not a video id at all")
 
+    def test_overlong_watch_id_raises(self):
+        with pytest.raises(ValueError):
+            extract_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQQ")
+
+    def test_short_url_with_extra_path_raises(self):
+        with pytest.raises(ValueError):
+            extract_video_id("https://youtu.be/dQw4w9WgXcQ/extra")
+
+    def test_watch_url_with_fragment(self):
+        assert extract_video_id("https://www.youtube.com/watch?v=dQw4w9WgXcQ#t=5") == "dQw4w9WgXcQ"
+
 
 class TestVideoIdRegex:
     """Test the VIDEO_ID_RE pattern directly."""
@@ -0,0 +1,57 @@
+"""Tests for yt_scribe.ytdlp — mocked yt-dlp, no network access."""
+import gc
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from yt_scribe.errors import MetadataFetchError
+from yt_scribe.ytdlp import YDL_OPTS, YDL_OPTS_FLAT, get_ydl
+
+OPTS = {"quiet": True, "skip_download": True}
+
+
+@pytest.fixture
+def mock_ytdlp():
+    mock_module = MagicMock()
+    mock_module.YoutubeDL.side_effect = lambda opts: MagicMock(opts=opts)
+    with patch.dict(sys.modules, {"yt_dlp": mock_module}):
+        yield mock_module
+
+
+class TestGetYdl:
+    def test_reused_for_same_opts(self, mock_ytdlp):
+        assert get_ydl(OPTS) is get_ydl(dict(OPTS))
+        assert mock_ytdlp.YoutubeDL.call_count == 1
+
+    def test_separate_per_opts(self, mock_ytdlp):
+        assert get_ydl(OPTS) is not get_ydl({**OPTS, "extract_flat": True})
+
+    def test_separate_per_thread(self, mock_ytdlp):
+        other = []
+        thread = threading.Thread(target=lambda: other.append(get_ydl(OPTS)))
+        thread.start()
+        thread.join()
+        assert other[0] is not get_ydl(OPTS)
+
+    def test_closed_when_thread_ends(self, mock_ytdlp):
+        other = []
+        thread = threading.Thread(target=lambda: other.append(get_ydl(OPTS)))
+        thread.start()
+        thread.join()
+        gc.collect()
+        other[0].close.assert_called_once_with()
+        assert not get_ydl(OPTS).close.called
+
+    def test_frozen_opts_passed_as_copy(self, mock_ytdlp):
+        ydl = get_ydl(YDL_OPTS_FLAT)
+        assert type(ydl.opts) is dict
+        assert ydl.opts == {**YDL_OPTS, "extract_flat": True}
+        with pytest.raises(TypeError):
+            YDL_OPTS["quiet"] = False
+
+    def test_missing_ytdlp_raises(self):
+        with patch.dict(sys.modules, {"yt_dlp": None}):
+            with pytest.raises(MetadataFetchError):
+                get_ydl(OPTS)
@@ -1,2 +1,9 @@
 """yt-scribe: YouTube transcript fetcher."""
+import logging
+
 __version__ = "0.7.0"
+
+# Library modules log under "yt_scribe.*". Without this, records would go
+# to logging's last-resort stderr handler whenever the CLI leaves logging
+# unconfigured (JSON output modes).
+logging.getLogger(__name__).addHandler(logging.NullHandler())
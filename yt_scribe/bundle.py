@@ -1,10 +1,62 @@
 """Bundle management: directories and index generation."""
 from __future__ import annotations
 
+import functools
+import json
+import logging
+import os
 import re
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from .errors import BundleWriteError
+
+log = logging.getLogger(__name__)
+
+MANIFEST_NAME = "_bundle.json"
+INDEX_JSON_NAME = "_index.json"
+_WRITE_PROBE_NAME = ".yt-scribe-write-check"
+
+# _index.md lists at most this many rows; _index.json always has them all
+INDEX_TABLE_MAX_ROWS = 1000
+
+# Bundles with fewer unread files than this are read serially; below it the
+# thread pool costs more than the overlapped I/O saves.
+_PARALLEL_READ_MIN = 16
+_READ_WORKERS = 8
+
+_INDEX_TEMPLATE = (
+    "---\n"
+    'bundle: "{bundle}"\n'
+    'query: "{query}"\n'
+    "count: {count}\n"
+    'created_at: "{created_at}"\n'
+    "{source_fm}"
+    "---\n"
+    "\n"
+    "# {bundle}\n"
+    "\n"
+    "{source_line}\n"
+    "> {count} transcripts\n"
+    "{overflow_note}"
+    "\n"
+    "## Contents\n"
+    "\n"
+    "| # | Title | Video |\n"
+    "|---|-------|-------|\n"
+    "{rows}"
+)
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# ASCII fast path for slugify(): keep [a-z0-9], turn everything else into a
+# space so str.split() can collapse runs and trim the ends in one C pass.
+_SLUG_TABLE = {
+    c: " " for c in range(128)
+    if chr(c) not in "abcdefghijklmnopqrstuvwxyz0123456789"
+}
+
 
 def slugify(text: str) -> str:
     """Convert text to a filesystem-safe slug for bundle directory names.
@@ -14,49 +66,237 @@ def slugify(text: str) -> str:
     truncate to 60 chars.
     """
     slug = text.lower()
-    slug = re.sub(r"[^a-z0-9]+", "_", slug)
-    slug = slug.strip("_")
-    return slug[:60]
+    if slug.isascii():
+        slug = slug.translate(_SLUG_TABLE)
+    else:
+        slug = _SLUG_RE.sub(" ", slug)
+    return "_".join(slug.split())[:60]
 
 
 def _parse_frontmatter(text: str) -> dict[str, str]:
-    """Parse flat YAML frontmatter from a markdown file's text content.
+    """Parse YAML frontmatter from a markdown file's text content.
+
+    Flat "key: value" blocks (everything yt-scribe writes) take a fast
+    line-by-line path. Blocks with nested keys, lists or comments are
+    handed to PyYAML when it is installed.
 
     Returns dict of key: value pairs with surrounding quotes stripped.
     """
-    parts = text.split("---", 2)
-    if len(parts) < 3:
+    if not text.startswith("---"):
         return {}
+    # Slice out just the frontmatter block; the transcript body can be large
+    end = text.find("\n---", 3)
+    if end < 0:
+        return {}
+    block = text[3:end].strip()
+    fm = _parse_frontmatter_flat(block)
+    if fm is None:
+        fm = _parse_frontmatter_yaml(block)
+    return fm
+
+
+def _parse_frontmatter_flat(block: str, strict: bool = True) -> dict[str, str] | None:
+    """Parse a flat "key: value" frontmatter block.
+
+    In strict mode, returns None as soon as a line doesn't fit the flat
+    shape (indented, list item, bare "key:", comment) so the caller can
+    fall back to YAML. Otherwise such lines are skipped.
+    """
     fm = {}
-    for line in parts[1].strip().splitlines():
-        if ": " not in line:
+    for line in block.splitlines():
+        if not line:
             continue
-        key, val = line.split(": ", 1)
-        val = val.strip().strip('"').strip("'")
-        fm[key.strip()] = val
+        idx = line.find(": ")
+        if idx <= 0 or line[0] in " \t-#":
+            if strict:
+                return None
+            continue
+        fm[line[:idx].strip()] = line[idx + 2:].strip().strip('"').strip("'")
     return fm
 
 
-def read_bundle_entries(bundle_dir: Path) -> list[tuple[str, str, Path]]:
+def _parse_frontmatter_yaml(block: str) -> dict[str, str]:
+    """Parse a non-flat frontmatter block with PyYAML (optional dependency).
+
+    Only top-level scalar values are kept, as strings. Without PyYAML, or
+    if the block isn't valid YAML, the "key: value" lines are still used.
+    """
+    try:
+        import yaml
+    except ImportError:
+        yaml = None
+
+    data = None
+    if yaml is not None:
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        try:
+            data = yaml.load(block, Loader=loader)
+        except yaml.YAMLError as e:
+            log.debug("Invalid YAML frontmatter: %s", e)
+
+    if not isinstance(data, dict):
+        return _parse_frontmatter_flat(block, strict=False)
+
+    return {
+        str(key): "" if val is None else str(val)
+        for key, val in data.items()
+        if not isinstance(val, (dict, list))
+    }
+
+
+def _read_frontmatter_block(path: str) -> str:
+    """Read a markdown file only up to the end of its frontmatter block.
+
+    Transcript bodies can run to megabytes; the frontmatter is a few lines
+    at the top, so stop reading at the closing "---".
+    """
+    with open(path, encoding="utf-8") as fh:
+        first = fh.readline()
+        if not first.startswith("---"):
+            return ""
+        lines = [first]
+        for line in fh:
+            lines.append(line)
+            if line.startswith("---"):
+                break
+    return "".join(lines)
+
+
+@functools.lru_cache(maxsize=4096)
+def _frontmatter_cached(path: str, mtime_ns: int, size: int) -> dict[str, str]:
+    """Read and parse a file's frontmatter, memoized on its stat signature.
+
+    *mtime_ns* and *size* only take part in the cache key, so an edited
+    file misses the cache and is parsed again.
+    """
+    return _parse_frontmatter(_read_frontmatter_block(path))
+
+
+def _scan_bundle(bundle_dir: Path) -> dict[str, os.DirEntry]:
+    """List the regular files in a bundle directory in one scandir pass.
+
+    Returns a dict mapping filename to DirEntry, sorted by filename.
+    DirEntry caches its stat() result, so later checks reuse one syscall.
+    """
+    with os.scandir(bundle_dir) as it:
+        files = [e for e in it if e.is_file()]
+    files.sort(key=lambda e: e.name)
+    return {e.name: e for e in files}
+
+
+def read_bundle_entries(
+    bundle_dir: Path,
+    known: list[tuple[str, str, Path]] | None = None,
+) -> list[tuple[str, str, Path]]:
     """Read existing transcript entries from a bundle directory.
 
     Scans all .md files (except _index.md), parses YAML frontmatter
-    for title and video_id.
+    for title and video_id. Files listed in *known* (as (title, video_id,
+    filepath) tuples, matched by filename) are trusted as-is and not read.
 
     Returns list of (title, video_id, filepath) tuples, sorted by filename.
     """
+    return _read_entries(bundle_dir, _scan_bundle(bundle_dir), known)
+
+
+def _read_entries(
+    bundle_dir: Path,
+    scanned: dict[str, os.DirEntry],
+    known: list[tuple[str, str, Path]] | None,
+) -> list[tuple[str, str, Path]]:
+    """read_bundle_entries() over an existing _scan_bundle() listing."""
+    known_by_name = {entry[2].name: entry for entry in known or ()}
+    dir_entries = [
+        e for name, e in scanned.items()
+        if name.endswith(".md") and name != "_index.md"
+    ]
+
+    # Files the manifest vouches for (same mtime and size) need no read
+    manifest = (_load_manifest(bundle_dir) if MANIFEST_NAME in scanned else None) or {}
+    fm_by_name: dict[str, dict[str, str]] = {}
+    unread = []
+    keys = []
+    for e in dir_entries:
+        if e.name in known_by_name:
+            continue
+        st = e.stat()
+        record = manifest.get(e.name)
+        # A damaged record (not a dict, or missing fields) is just a miss
+        if (
+            isinstance(record, dict)
+            and record.get("mtime_ns") == st.st_mtime_ns
+            and record.get("size") == st.st_size
+        ):
+            fm_by_name[e.name] = record
+            continue
+        unread.append(e)
+        keys.append((e.path, st.st_mtime_ns, st.st_size))
+
+    if len(keys) >= _PARALLEL_READ_MIN:
+        # File reads release the GIL, so overlap them on slow storage
+        with ThreadPoolExecutor(max_workers=_READ_WORKERS) as ex:
+            parsed = list(ex.map(lambda key: _frontmatter_cached(*key), keys))
+    else:
+        parsed = [_frontmatter_cached(*key) for key in keys]
+    fm_by_name.update((e.name, fm) for e, fm in zip(unread, parsed))
+
     entries = []
-    for md_file in sorted(bundle_dir.glob("*.md")):
-        if md_file.name == "_index.md":
+    for e in dir_entries:
+        if e.name in known_by_name:
+            entries.append(known_by_name[e.name])
             continue
-        text = md_file.read_text(encoding="utf-8")
-        fm = _parse_frontmatter(text)
-        title = fm.get("title", md_file.stem)
+        fm = fm_by_name[e.name]
+        title = fm.get("title", e.name[:-3])
         video_id = fm.get("video_id", "")
-        entries.append((title, video_id, md_file))
+        entries.append((title, video_id, Path(e.path)))
     return entries
 
 
+def _load_manifest(bundle_dir: Path) -> dict[str, dict] | None:
+    """Load the bundle manifest written by generate_index().
+
+    Returns a dict mapping filename to {title, video_id, mtime_ns, size},
+    or None if the manifest is missing or unreadable.
+    """
+    try:
+        data = json.loads((bundle_dir / MANIFEST_NAME).read_bytes())
+        files = data["files"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return files if isinstance(files, dict) else None
+
+
+def _write_manifest(
+    bundle_dir: Path,
+    entries: list[tuple[str, str, Path]],
+    scanned: dict[str, os.DirEntry] | None = None,
+) -> None:
+    """Record title, video_id and stat signature for each bundle entry.
+
+    Lets the next read_bundle_entries() skip opening unchanged files.
+    Stat results are taken from *scanned* where available. Entries whose
+    file has gone missing are left out.
+    """
+    scanned = scanned or {}
+    files = {}
+    for title, video_id, filepath in entries:
+        try:
+            dir_entry = scanned.get(filepath.name)
+            st = dir_entry.stat() if dir_entry is not None else filepath.stat()
+        except OSError:
+            continue
+        files[filepath.name] = {
+            "title": title,
+            "video_id": video_id,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+        }
+    manifest_path = bundle_dir / MANIFEST_NAME
+    tmp_path = manifest_path.with_name(MANIFEST_NAME + ".tmp")
+    tmp_path.write_bytes(json.dumps({"version": 1, "files": files}).encode("utf-8"))
+    os.replace(tmp_path, manifest_path)
+
+
 def _read_index_metadata(bundle_dir: Path) -> dict | None:
     """Read metadata from existing _index.md frontmatter.
 
@@ -64,9 +304,10 @@ def _read_index_metadata(bundle_dir: Path) -> dict | None:
     Returns None if _index.md doesn't exist.
     """
     index_path = bundle_dir / "_index.md"
-    if not index_path.is_file():
+    try:
+        text = index_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         return None
-    text = index_path.read_text(encoding="utf-8")
     fm = _parse_frontmatter(text)
     return {
         "bundle": fm.get("bundle", ""),
@@ -76,24 +317,61 @@ def _read_index_metadata(bundle_dir: Path) -> dict | None:
     }
 
 
+_now_cache: tuple[int, str] = (-1, "")
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as "YYYY-MM-DD HH:MM:SS UTC".
+
+    The string only changes once a second, so reuse it across indexes
+    generated within the same second.
+    """
+    global _now_cache
+    now = int(time.time())
+    if _now_cache[0] != now:
+        _now_cache = (now, time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime(now)))
+    return _now_cache[1]
+
+
 def create_bundle_dir(bundle_name: str, output_base: Path | None = None) -> Path:
     """Create and return a bundle directory path.
 
     Default: ./transcripts/{bundle_name}/
     With output_base: {output_base}/{bundle_name}/
+
+    Creates and removes a probe file so an unwritable directory is
+    reported before any videos are fetched, not once per video after.
+    Raises BundleWriteError if the directory cannot be created or written.
     """
     base = output_base or Path("transcripts")
     bundle_dir = base / bundle_name
-    bundle_dir.mkdir(parents=True, exist_ok=True)
+    probe = bundle_dir / _WRITE_PROBE_NAME
+    try:
+        bundle_dir.mkdir(parents=True, exist_ok=True)
+        probe.touch()
+        probe.unlink()
+    except OSError as e:
+        raise BundleWriteError(f"Cannot write to bundle directory {bundle_dir}: {e}") from e
     return bundle_dir
 
 
+def bundle_has_files(bundle_dir: Path) -> bool:
+    """Return True if *bundle_dir* already contains anything.
+
+    Commands check this before fetching: a fresh bundle holds only what
+    they save, so generate_index() can skip its rescan.
+    """
+    with os.scandir(bundle_dir) as it:
+        return next(it, None) is not None
+
+
 def generate_index(
     bundle_dir: Path,
     bundle_name: str,
     query: str,
     saved_files: list[tuple[str, str, Path]],
     source_url: str | None = None,
+    rescan: bool = True,
 ) -> Path:
     """Generate _index.md for a bundle.
 
@@ -103,11 +381,20 @@ def generate_index(
         query: Original search query (or playlist title).
         saved_files: List of (title, video_id, filepath) tuples.
         source_url: Optional playlist URL to link back to in the index.
+        rescan: Scan the directory for other transcripts. Pass False when
+            saved_files is known to be the complete bundle contents.
 
     Returns the path to the created _index.md file.
     """
-    # 1. Check if _index.md already exists — preserve original metadata
-    existing_meta = _read_index_metadata(bundle_dir)
+    # 1. One directory scan answers whether _index.md exists and which
+    #    transcripts are present, with stat results cached on each entry
+    scanned = _scan_bundle(bundle_dir) if rescan else None
+
+    # 2. Check if _index.md already exists — preserve original metadata
+    if scanned is None or "_index.md" in scanned:
+        existing_meta = _read_index_metadata(bundle_dir)
+    else:
+        existing_meta = None
 
     if existing_meta:
         bundle_name = existing_meta.get("bundle") or bundle_name
@@ -117,55 +404,71 @@ def generate_index(
     else:
         original_created_at = None
 
-    # 2. Scan the directory for ALL .md files (not just saved_files)
-    all_entries = read_bundle_entries(bundle_dir)
+    # 3. Use ALL .md files in the directory (not just saved_files);
+    #    only files we didn't just save need their frontmatter parsed
+    if scanned is not None:
+        all_entries = _read_entries(bundle_dir, scanned, saved_files)
+    else:
+        # A video given twice was saved to the same file; keep one row
+        # per file, as the directory scan would
+        unique = {entry[2].name: entry for entry in saved_files}
+        all_entries = sorted(unique.values(), key=lambda entry: entry[2].name)
 
-    # 3. Fall back to saved_files if scan found nothing
+    # 4. Fall back to saved_files if scan found nothing
     if not all_entries:
         all_entries = saved_files
 
     count = len(all_entries)
-    now = original_created_at or datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-
-    lines = [
-        "---",
-        f'bundle: "{bundle_name}"',
-        f'query: "{query}"',
-        f"count: {count}",
-        f'created_at: "{now}"',
-    ]
-
-    if source_url:
-        lines.append(f'source_url: "{source_url}"')
-
-    lines.extend([
-        "---",
-        "",
-        f"# {bundle_name}",
-        "",
-    ])
-
-    if source_url:
-        lines.append(f"> Source: [{query}]({source_url})")
+    now = original_created_at or _utc_timestamp()
+
+    rows = "".join(
+        f"| {i} | [{title}](./{filepath.name}) | [YouTube](https://youtube.com/watch?v={video_id}) |\n"
+        for i, (title, video_id, filepath) in enumerate(all_entries[:INDEX_TABLE_MAX_ROWS], 1)
+    )
+    if count > INDEX_TABLE_MAX_ROWS:
+        overflow_note = (
+            f"> Showing the first {INDEX_TABLE_MAX_ROWS};"
+            f" the full list is in [{INDEX_JSON_NAME}](./{INDEX_JSON_NAME})\n"
+        )
     else:
-        lines.append(f'> Search query: "{query}"')
-
-    lines.append(f"> {count} transcripts")
-    lines.extend([
-        "",
-        "## Contents",
-        "",
-        "| # | Title | Video |",
-        "|---|-------|-------|",
-    ])
-
-    for i, (title, video_id, filepath) in enumerate(all_entries, 1):
-        fname = filepath.name
-        yt_url = f"https://youtube.com/watch?v={video_id}"
-        lines.append(f"| {i} | [{title}](./{fname}) | [YouTube]({yt_url}) |")
-
-    lines.append("")
+        overflow_note = ""
+
+    content = _INDEX_TEMPLATE.format_map({
+        "bundle": bundle_name,
+        "query": query,
+        "count": count,
+        "created_at": now,
+        "source_fm": f'source_url: "{source_url}"\n' if source_url else "",
+        "source_line": (
+            f"> Source: [{query}]({source_url})" if source_url
+            else f'> Search query: "{query}"'
+        ),
+        "overflow_note": overflow_note,
+        "rows": rows,
+    })
 
     index_path = bundle_dir / "_index.md"
-    index_path.write_text("\n".join(lines), encoding="utf-8")
+    index_path.write_bytes(content.encode("utf-8"))
+
+    index_data = {
+        "bundle": bundle_name,
+        "query": query,
+        "source_url": source_url,
+        "count": count,
+        "created_at": now,
+        "entries": [
+            {
+                "title": title,
+                "video_id": video_id,
+                "filename": filepath.name,
+                "url": f"https://youtube.com/watch?v={video_id}",
+            }
+            for title, video_id, filepath in all_entries
+        ],
+    }
+    (bundle_dir / INDEX_JSON_NAME).write_bytes(
+        json.dumps(index_data, ensure_ascii=False).encode("utf-8")
+    )
+
+    _write_manifest(bundle_dir, all_entries, scanned)
     return index_path
@@ -0,0 +1,134 @@
+"""On-disk cache for fetched metadata and transcripts.
+
+Re-running a command fetches the same videos again. Successful fetches
+are stored as JSON under $XDG_CACHE_HOME/yt-scribe (default
+~/.cache/yt-scribe) and reused for METADATA_TTL_SECONDS (metadata, which
+can be edited) or TRANSCRIPT_TTL_SECONDS (transcripts). Failures are
+never cached.
+
+The cache is best-effort: an unreadable, corrupt or unwritable cache, or
+an entry whose fields no longer match the data classes, is treated as a
+miss and logged at debug level.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .metadata import VideoMetadata
+    from .transcript import TranscriptResult
+
+log = logging.getLogger(__name__)
+
+METADATA_TTL_SECONDS = 24 * 60 * 60
+TRANSCRIPT_TTL_SECONDS = 7 * 24 * 60 * 60
+CACHE_VERSION = 1
+
+
+def cache_dir() -> Path:
+    """Return the cache directory, honouring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "yt-scribe"
+
+
+def _cache_path(kind: str, key: str) -> Path:
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return cache_dir() / kind / f"{digest}.json"
+
+
+def _load(kind: str, key: str, ttl: float) -> dict | None:
+    """Return the cached value for *key*, or None on a miss or an entry older than *ttl*."""
+    path = _cache_path(kind, key)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        data = json.loads(path.read_bytes())
+        if data.get("version") != CACHE_VERSION or data.get("key") != key:
+            return None
+        return data["value"]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        log.debug("Ignoring unreadable cache entry %s: %s", path, e)
+        return None
+
+
+def _store(kind: str, key: str, value: dict) -> None:
+    """Write *value* for *key* atomically; errors are logged and ignored."""
+    path = _cache_path(kind, key)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    payload = {"version": CACHE_VERSION, "key": key, "value": value}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log.debug("Could not write cache entry %s: %s", path, e)
+
+
+def fetch_metadata_cached(
+    video_id: str,
+    enrich: bool = False,
+    refresh: bool = False,
+) -> VideoMetadata:
+    """fetch_metadata() with results cached on disk per (video_id, enrich).
+
+    With *refresh*, skip the cached entry but store the new result.
+    """
+    from .metadata import VideoMetadata, fetch_metadata
+
+    key = f"{video_id}:{int(enrich)}"
+    cached = None if refresh else _load("metadata", key, METADATA_TTL_SECONDS)
+    if cached is not None:
+        # An entry from another schema (or hand-edited) is just a miss
+        try:
+            meta = VideoMetadata(**cached)
+        except TypeError as e:
+            log.debug("Ignoring mismatched metadata cache entry for %s: %s", video_id, e)
+        else:
+            log.debug("Metadata cache hit for %s", video_id)
+            return meta
+
+    meta = fetch_metadata(video_id, enrich=enrich)
+    # An enriched request that fell back to oEmbed is not worth keeping;
+    # the next run should try yt-dlp again.
+    if not enrich or meta.source == "yt-dlp":
+        _store("metadata", key, asdict(meta))
+    return meta
+
+
+def fetch_transcript_cached(
+    video_id: str,
+    languages: list[str] | None = None,
+    refresh: bool = False,
+) -> TranscriptResult:
+    """fetch_transcript() with results cached on disk per (video_id, languages).
+
+    With *refresh*, skip the cached entry but store the new result.
+    """
+    from .transcript import TranscriptResult, TranscriptSegment, fetch_transcript
+
+    key = f"{video_id}:{','.join(languages or ['en'])}"
+    cached = None if refresh else _load("transcript", key, TRANSCRIPT_TTL_SECONDS)
+    if cached is not None:
+        try:
+            segments = [TranscriptSegment(**seg) for seg in cached.pop("segments")]
+            transcript = TranscriptResult(segments=segments, **cached)
+        except (TypeError, KeyError, AttributeError) as e:
+            log.debug("Ignoring mismatched transcript cache entry for %s: %s", video_id, e)
+        else:
+            log.debug("Transcript cache hit for %s", video_id)
+            return transcript
+
+    transcript = fetch_transcript(video_id, languages=languages)
+    _store("transcript", key, asdict(transcript))
+    return transcript
@@ -2,21 +2,96 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import itertools
+import json
 import logging
+import os
 import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from . import __version__
 from .config import load_config, apply_config_defaults
-from .url_parser import extract_video_id
-from .metadata import fetch_metadata
-from .transcript import fetch_transcript
-from .formatter import format_markdown, format_json, generate_filename
 from .errors import YtScribeError
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Fetching and formatting modules pull in requests, youtube-transcript-api
+# and friends, so each command imports what it needs when it runs. That
+# keeps --help, --version and `search --json` from paying for the rest.
+
 log = logging.getLogger("yt-scribe")
 
 
+def _json_bytes(obj: object, pretty: bool = False) -> bytes:
+    """Serialize *obj* to UTF-8 JSON, via orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _write_json_stdout(obj: object) -> None:
+    """Write *obj* as JSON to stdout, indented for a terminal, compact when piped."""
+    _write_stdout_bytes(_json_bytes(obj, pretty=sys.stdout.isatty()))
+
+
+_STDOUT_CHUNK_SIZE = 1 << 20
+
+
+def _write_stdout_bytes(data: bytes) -> None:
+    """Write UTF-8 *data* to stdout, bypassing Python's stream layers when possible.
+
+    When stdout is a pipe or file, the data goes straight to the file
+    descriptor with os.write() in 1 MiB slices, which a pipe reader can
+    drain as they arrive. A terminal, or a stdout replaced by an object
+    without a real file descriptor, gets an ordinary write and flush.
+    """
+    out = sys.stdout
+    out.flush()
+    if not out.isatty():
+        try:
+            fd = out.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = None
+        if fd is not None:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view[:_STDOUT_CHUNK_SIZE]):]
+            return
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        out.write(data.decode("utf-8"))
+        out.flush()
+        return
+    buffer.write(data)
+    buffer.flush()
+
+
+def _add_cache_args(parser: argparse.ArgumentParser) -> None:
+    """Add the options controlling the on-disk fetch cache."""
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch from YouTube instead of reusing cached metadata and transcripts",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-fetch from YouTube and update the cache",
+    )
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="yt-scribe",
@@ -66,6 +141,7 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Print to stdout instead of writing a file",
     )
+    _add_cache_args(parser)
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -79,6 +155,175 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _init_logging(verbose: bool, quiet: bool = False) -> None:
+    """Send log records to stderr: DEBUG with -v, otherwise WARNING and up.
+
+    With *quiet* (JSON output meant for another program) and no -v,
+    logging is left unconfigured: the library modules under yt_scribe.*
+    stay silent, while warnings from the CLI's own "yt-scribe" logger,
+    such as config file problems, still reach stderr through logging's
+    last-resort handler.
+    """
+    if quiet and not verbose:
+        return
+    logging.basicConfig(
+        format="%(levelname)s: %(message)s",
+        level=logging.DEBUG if verbose else logging.WARNING,
+        stream=sys.stderr,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Shared bundle fetching
+# ---------------------------------------------------------------------------
+
+DEFAULT_CONCURRENCY = 4
+_WRITE_BATCH_CHUNKS = 1024
+
+
+def _encode_batches(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Join *chunks* in groups of _WRITE_BATCH_CHUNKS and encode each to UTF-8.
+
+    One join and one encode per group replaces the text layer's per-chunk
+    encoder calls, while memory stays bounded for long transcripts.
+    """
+    it = iter(chunks)
+    while batch := list(itertools.islice(it, _WRITE_BATCH_CHUNKS)):
+        yield "".join(batch).encode("utf-8")
+
+
+def _write_chunks(path: Path, chunks: Iterable[bytes]) -> None:
+    """Write encoded chunks to *path*, one binary write each.
+
+    Streams long transcripts from iter_json_bytes() or _encode_batches()
+    without materializing the whole document.
+    """
+    with open(path, "wb") as fh:
+        for data in chunks:
+            fh.write(data)
+
+
+def _get_fetchers(use_cache: bool = True, refresh: bool = False) -> tuple[Callable, Callable]:
+    """Return the (fetch_metadata, fetch_transcript) pair a command should use.
+
+    With *use_cache*, fetches go through the on-disk cache in cache.py;
+    *refresh* re-fetches everything but still updates the cache.
+    """
+    if not use_cache:
+        from .metadata import fetch_metadata
+        from .transcript import fetch_transcript
+        return fetch_metadata, fetch_transcript
+
+    from .cache import fetch_metadata_cached, fetch_transcript_cached
+    return (
+        functools.partial(fetch_metadata_cached, refresh=refresh),
+        functools.partial(fetch_transcript_cached, refresh=refresh),
+    )
+
+
+def _fetch_and_write(
+    video: str,
+    lang: list[str] | None,
+    bundle_dir: Path,
+    fetchers: tuple[Callable, Callable],
+    fetched_at: datetime,
+) -> tuple[str, str, Path]:
+    """Fetch one video's metadata and transcript and save it into a bundle.
+
+    *video* may be a URL or a bare video ID; *fetchers* comes from
+    _get_fetchers(); *fetched_at* is recorded in the frontmatter. Runs on
+    a worker thread; the work is network-bound, and every video writes
+    to its own file.
+
+    Returns the (title, video_id, filepath) entry for the bundle index.
+    """
+    from .url_parser import extract_video_id
+    from .formatter import iter_markdown, generate_filename
+
+    fetch_metadata, fetch_transcript = fetchers
+    video_id = extract_video_id(video)
+    meta = fetch_metadata(video_id, enrich=True)
+    transcript = fetch_transcript(video_id, languages=lang)
+
+    # Backfill duration
+    if meta.duration_seconds is None:
+        meta.duration_seconds = transcript.duration_seconds
+
+    output_path = bundle_dir / (generate_filename(meta) + ".md")
+    _write_chunks(output_path, _encode_batches(iter_markdown(meta, transcript, fetched_at)))
+    return meta.title, meta.video_id, output_path
+
+
+def _run_fetch_loop(
+    videos: list[str],
+    lang: list[str] | None,
+    bundle_dir: Path,
+    fetchers: tuple[Callable, Callable],
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Iterator[tuple[int, int, tuple[str, str, Path] | None, Exception | None]]:
+    """Fetch *videos* into *bundle_dir* on a thread pool, yielding as each finishes.
+
+    Shared by search, playlist and batch, which only differ in how they
+    report progress. Yields (done, position, entry, error) in completion
+    order: *done* counts finished videos from 1, *position* indexes into
+    *videos*, and exactly one of *entry* (from _fetch_and_write) or
+    *error* is set. Pending fetches are cancelled if the caller stops
+    early or is interrupted.
+    """
+    from datetime import datetime, timezone
+
+    # One fetch time for the whole run; every file in the bundle shares it.
+    fetched_at = datetime.now(timezone.utc)
+    executor = ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(videos))))
+    try:
+        futures = {
+            executor.submit(
+                _fetch_and_write, video, lang, bundle_dir, fetchers, fetched_at,
+            ): position
+            for position, video in enumerate(videos)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            position = futures[future]
+            try:
+                entry = future.result()
+            except Exception as e:
+                if not isinstance(e, (YtScribeError, ValueError)):
+                    log.debug("Unexpected error for %s: %s", videos[position], e)
+                yield done, position, None, e
+            else:
+                yield done, position, entry, None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _add_bundle_fetch_args(parser: argparse.ArgumentParser) -> None:
+    """Add the output and fetch options shared by search, playlist and batch."""
+    parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        default=None,
+        help="Base output directory (default: ./transcripts/)",
+    )
+    parser.add_argument(
+        "-l", "--lang",
+        nargs="+",
+        default=None,
+        help="Preferred transcript language(s) (default: en)",
+    )
+    parser.add_argument(
+        "-j", "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of videos to fetch in parallel (default: {DEFAULT_CONCURRENCY})",
+    )
+    _add_cache_args(parser)
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Enable verbose logging",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Search CLI
 # ---------------------------------------------------------------------------
@@ -103,39 +348,28 @@ def build_search_parser() -> argparse.ArgumentParser:
         default=None,
         help="Bundle name (default: auto-generated from query)",
     )
-    parser.add_argument(
-        "-o", "--output",
-        type=Path,
-        default=None,
-        help="Base output directory (default: ./transcripts/)",
-    )
-    parser.add_argument(
-        "-l", "--lang",
-        nargs="+",
-        default=None,
-        help="Preferred transcript language(s) (default: en)",
-    )
     parser.add_argument(
         "--json",
         action="store_true",
         dest="json_output",
         help="Output search results as JSON to stdout (non-interactive, no prompts)",
     )
-    parser.add_argument(
-        "-v", "--verbose",
-        action="store_true",
-        help="Enable verbose logging",
-    )
+    _add_bundle_fetch_args(parser)
     return parser
 
 
+@functools.lru_cache(maxsize=4096)
 def _format_duration_short(seconds: int | float | None) -> str:
-    """Format duration as MM:SS or H:MM:SS."""
+    """Format duration as MM:SS or H:MM:SS.
+
+    Memoized: result tables repeat the same durations across runs of the
+    display loop. Pass whole seconds so equal durations share an entry.
+    """
     if seconds is None:
         return "  ???"
     seconds = int(seconds)
-    hours, remainder = divmod(seconds, 3600)
-    minutes, secs = divmod(remainder, 60)
+    hours, remainder = seconds // 3600, seconds % 3600
+    minutes, secs = remainder // 60, remainder % 60
     if hours > 0:
         return f"{hours}:{minutes:02d}:{secs:02d}"
     return f"{minutes:>2d}:{secs:02d}"
@@ -153,17 +387,20 @@ def _format_views(count: int | None) -> str:
 
 
 def _display_results(results: list) -> None:
-    """Print a formatted table of search results."""
-    print()
-    print(f"  {'#':>3}  {'Title':<45}  {'Channel':<15}  {'Views':>6}  {'Uploaded':<10}  {'Duration':>8}")
+    """Print a formatted table of search results in a single write."""
+    lines = [
+        "",
+        f"  {'#':>3}  {'Title':<45}  {'Channel':<15}  {'Views':>6}  {'Uploaded':<10}  {'Duration':>8}",
+    ]
     for i, r in enumerate(results, 1):
         title = r.title[:42] + "..." if len(r.title) > 45 else r.title
-        channel = r.channel[:15] if r.channel else "Unknown"
+        channel = (r.channel or "Unknown")[:15]
         views = _format_views(r.view_count)
         uploaded = r.upload_date if r.upload_date else "-"
-        dur = _format_duration_short(r.duration_seconds)
-        print(f"  {i:>3}  {title:<45}  {channel:<15}  {views:>6}  {uploaded:<10}  {dur:>8}")
-    print()
+        dur = _format_duration_short(None if r.duration_seconds is None else int(r.duration_seconds))
+        lines.append(f"  {i:>3}  {title:<45}  {channel:<15}  {views:>6}  {uploaded:<10}  {dur:>8}")
+    lines.append("\n")
+    sys.stdout.write("\n".join(lines))
 
 
 def parse_selection(input_str: str, max_val: int) -> list[int]:
@@ -179,7 +416,9 @@ def parse_selection(input_str: str, max_val: int) -> list[int]:
     if input_str == "all":
         return list(range(1, max_val + 1))
 
-    indices = []
+    # Deduplicate while preserving order, in the same pass as parsing
+    seen: set[int] = set()
+    unique: list[int] = []
     for part in input_str.split(","):
         part = part.strip()
         if "-" in part:
@@ -187,27 +426,24 @@ def parse_selection(input_str: str, max_val: int) -> list[int]:
             lo, hi = int(bounds[0]), int(bounds[1])
             if lo < 1 or hi > max_val or lo > hi:
                 raise ValueError(f"Range {part} is out of bounds (1-{max_val})")
-            indices.extend(range(lo, hi + 1))
+            for idx in range(lo, hi + 1):
+                if idx not in seen:
+                    seen.add(idx)
+                    unique.append(idx)
         else:
             val = int(part)
             if val < 1 or val > max_val:
                 raise ValueError(f"{val} is out of bounds (1-{max_val})")
-            indices.append(val)
-
-    # Deduplicate while preserving order
-    seen = set()
-    unique = []
-    for idx in indices:
-        if idx not in seen:
-            seen.add(idx)
-            unique.append(idx)
+            if val not in seen:
+                seen.add(val)
+                unique.append(val)
     return unique
 
 
 def search_main(argv: list[str]) -> int:
     """Search YouTube, display results, and download selected transcripts as a bundle."""
     from .search import search_youtube
-    from .bundle import create_bundle_dir, generate_index, slugify
+    from .bundle import bundle_has_files, create_bundle_dir, generate_index, slugify
 
     parser = build_search_parser()
     args = parser.parse_args(argv)
@@ -216,12 +452,7 @@ def search_main(argv: list[str]) -> int:
 
     max_results = min(args.results, 25)
 
-    level = logging.DEBUG if args.verbose else logging.WARNING
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s",
-        level=level,
-        stream=sys.stderr,
-    )
+    _init_logging(args.verbose, quiet=args.json_output)
 
     try:
         # 1. Search
@@ -235,7 +466,6 @@ def search_main(argv: list[str]) -> int:
 
         # JSON mode: output and exit immediately
         if args.json_output:
-            import json
             output = [
                 {
                     "index": i,
@@ -250,7 +480,7 @@ def search_main(argv: list[str]) -> int:
                 }
                 for i, r in enumerate(results, 1)
             ]
-            sys.stdout.write(json.dumps(output, indent=2, ensure_ascii=False))
+            _write_json_stdout(output)
             return 0
 
         # 2. Display results
@@ -262,10 +492,10 @@ def search_main(argv: list[str]) -> int:
                 raw = input("Select videos (e.g. 1,3,5 or 1-5 or all): ")
                 selected = parse_selection(raw, len(results))
                 break
-            except (ValueError, KeyboardInterrupt) as e:
-                if isinstance(e, KeyboardInterrupt):
-                    print("\nAborted.", file=sys.stderr)
-                    return 130
+            except KeyboardInterrupt:
+                print("\nAborted.", file=sys.stderr)
+                return 130
+            except ValueError as e:
                 print(f"Invalid selection: {e}. Try again.")
 
         # 4. Get bundle name
@@ -275,46 +505,42 @@ def search_main(argv: list[str]) -> int:
 
         # 5. Create bundle directory
         bundle_dir = create_bundle_dir(bundle_name, output_base=args.output)
+        rescan = bundle_has_files(bundle_dir)
 
-        # 6. Fetch transcripts for selected videos
+        # 6. Fetch transcripts for selected videos, several at a time
+        chosen = [results[sel_idx - 1] for sel_idx in selected]
+        # Search can return a video twice; fetch (and write) it once
+        chosen = list({result.video_id: result for result in chosen}.values())
         saved_files: list[tuple[str, str, Path]] = []
-        total = len(selected)
-
-        for i, sel_idx in enumerate(selected, 1):
-            result = results[sel_idx - 1]
-            print(f"\nFetching {i}/{total}: {result.title}...")
+        total = len(chosen)
+        print(f"\nFetching {total} transcripts...")
 
-            try:
-                meta = fetch_metadata(result.video_id, enrich=True)
-                transcript = fetch_transcript(result.video_id, languages=args.lang)
-
-                # Backfill duration
-                if meta.duration_seconds is None:
-                    meta.duration_seconds = transcript.duration_seconds
-
-                content = format_markdown(meta, transcript)
-                filename = generate_filename(meta) + ".md"
-                output_path = bundle_dir / filename
-
-                output_path.write_text(content, encoding="utf-8")
-                print(f"  Saved: {output_path}")
-
-                saved_files.append((meta.title, meta.video_id, output_path))
-
-            except YtScribeError as e:
-                print(f"  Warning: Skipped — {e}", file=sys.stderr)
-                continue
-            except Exception as e:
-                log.debug("Unexpected error for %s: %s", result.video_id, e)
-                print(f"  Warning: Skipped — {e}", file=sys.stderr)
-                continue
+        fetches = _run_fetch_loop(
+            [result.video_id for result in chosen], args.lang, bundle_dir,
+            _get_fetchers(not args.no_cache, args.refresh), concurrency=args.concurrency,
+        )
+        try:
+            for done, position, entry, error in fetches:
+                if error is not None:
+                    print(f"  [{done}/{total}] Warning: Skipped {chosen[position].title} — {error}", file=sys.stderr)
+                    continue
+                saved_files.append(entry)
+                print(f"  [{done}/{total}] Saved: {entry[2]}")
+        except KeyboardInterrupt:
+            # Index what already reached disk, so an interrupted run
+            # still leaves a usable bundle
+            if saved_files:
+                generate_index(bundle_dir, bundle_name, args.query, saved_files, rescan=rescan)
+            raise
 
         if not saved_files:
             print("\nNo transcripts were saved.", file=sys.stderr)
             return 1
 
         # 7. Generate index
-        index_path = generate_index(bundle_dir, bundle_name, args.query, saved_files)
+        index_path = generate_index(
+            bundle_dir, bundle_name, args.query, saved_files, rescan=rescan,
+        )
         print(f"\nCreated index: {index_path}")
         print(f"Bundle complete: {len(saved_files)} transcripts saved to {bundle_dir}/")
         return 0
@@ -349,48 +575,27 @@ def build_playlist_parser() -> argparse.ArgumentParser:
         default=None,
         help="Bundle name (default: auto-generated from playlist title)",
     )
-    parser.add_argument(
-        "-o", "--output",
-        type=Path,
-        default=None,
-        help="Base output directory (default: ./transcripts/)",
-    )
-    parser.add_argument(
-        "-l", "--lang",
-        nargs="+",
-        default=None,
-        help="Preferred transcript language(s) (default: en)",
-    )
     parser.add_argument(
         "--json",
         action="store_true",
         dest="json_output",
         help="Output playlist info as JSON to stdout (non-interactive, no prompts)",
     )
-    parser.add_argument(
-        "-v", "--verbose",
-        action="store_true",
-        help="Enable verbose logging",
-    )
+    _add_bundle_fetch_args(parser)
     return parser
 
 
 def playlist_main(argv: list[str]) -> int:
     """Fetch a YouTube playlist, display videos, and download selected transcripts as a bundle."""
     from .search import fetch_playlist
-    from .bundle import create_bundle_dir, generate_index, slugify
+    from .bundle import bundle_has_files, create_bundle_dir, generate_index, slugify
 
     parser = build_playlist_parser()
     args = parser.parse_args(argv)
     config = load_config()
     apply_config_defaults(args, config)
 
-    level = logging.DEBUG if args.verbose else logging.WARNING
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s",
-        level=level,
-        stream=sys.stderr,
-    )
+    _init_logging(args.verbose, quiet=args.json_output)
 
     try:
         # 1. Fetch playlist
@@ -402,7 +607,6 @@ def playlist_main(argv: list[str]) -> int:
 
         # JSON mode: output and exit immediately
         if args.json_output:
-            import json
             output = {
                 "title": playlist_info.title,
                 "playlist_url": playlist_info.playlist_url,
@@ -422,7 +626,7 @@ def playlist_main(argv: list[str]) -> int:
                     for i, v in enumerate(playlist_info.videos, 1)
                 ],
             }
-            sys.stdout.write(json.dumps(output, indent=2, ensure_ascii=False))
+            _write_json_stdout(output)
             return 0
 
         # 2. Display results
@@ -434,10 +638,10 @@ def playlist_main(argv: list[str]) -> int:
                 raw = input("Select videos (e.g. 1,3,5 or 1-5 or all): ")
                 selected = parse_selection(raw, len(playlist_info.videos))
                 break
-            except (ValueError, KeyboardInterrupt) as e:
-                if isinstance(e, KeyboardInterrupt):
-                    print("\nAborted.", file=sys.stderr)
-                    return 130
+            except KeyboardInterrupt:
+                print("\nAborted.", file=sys.stderr)
+                return 130
+            except ValueError as e:
                 print(f"Invalid selection: {e}. Try again.")
 
         # 4. Get bundle name
@@ -447,39 +651,36 @@ def playlist_main(argv: list[str]) -> int:
 
         # 5. Create bundle directory
         bundle_dir = create_bundle_dir(bundle_name, output_base=args.output)
+        rescan = bundle_has_files(bundle_dir)
 
-        # 6. Fetch transcripts for selected videos
+        # 6. Fetch transcripts for selected videos, several at a time
+        chosen = [playlist_info.videos[sel_idx - 1] for sel_idx in selected]
+        # A playlist can list a video twice; fetch (and write) it once
+        chosen = list({result.video_id: result for result in chosen}.values())
         saved_files: list[tuple[str, str, Path]] = []
-        total = len(selected)
-
-        for i, sel_idx in enumerate(selected, 1):
-            result = playlist_info.videos[sel_idx - 1]
-            print(f"\nFetching {i}/{total}: {result.title}...")
-
-            try:
-                meta = fetch_metadata(result.video_id, enrich=True)
-                transcript = fetch_transcript(result.video_id, languages=args.lang)
-
-                # Backfill duration
-                if meta.duration_seconds is None:
-                    meta.duration_seconds = transcript.duration_seconds
+        total = len(chosen)
+        print(f"\nFetching {total} transcripts...")
 
-                content = format_markdown(meta, transcript)
-                filename = generate_filename(meta) + ".md"
-                output_path = bundle_dir / filename
-
-                output_path.write_text(content, encoding="utf-8")
-                print(f"  Saved: {output_path}")
-
-                saved_files.append((meta.title, meta.video_id, output_path))
-
-            except YtScribeError as e:
-                print(f"  Warning: Skipped — {e}", file=sys.stderr)
-                continue
-            except Exception as e:
-                log.debug("Unexpected error for %s: %s", result.video_id, e)
-                print(f"  Warning: Skipped — {e}", file=sys.stderr)
-                continue
+        fetches = _run_fetch_loop(
+            [result.video_id for result in chosen], args.lang, bundle_dir,
+            _get_fetchers(not args.no_cache, args.refresh), concurrency=args.concurrency,
+        )
+        try:
+            for done, position, entry, error in fetches:
+                if error is not None:
+                    print(f"  [{done}/{total}] Warning: Skipped {chosen[position].title} — {error}", file=sys.stderr)
+                    continue
+                saved_files.append(entry)
+                print(f"  [{done}/{total}] Saved: {entry[2]}")
+        except KeyboardInterrupt:
+            # Index what already reached disk, so an interrupted run
+            # still leaves a usable bundle
+            if saved_files:
+                generate_index(
+                    bundle_dir, bundle_name, playlist_info.title, saved_files,
+                    source_url=args.url, rescan=rescan,
+                )
+            raise
 
         if not saved_files:
             print("\nNo transcripts were saved.", file=sys.stderr)
@@ -488,7 +689,7 @@ def playlist_main(argv: list[str]) -> int:
         # 7. Generate index
         index_path = generate_index(
             bundle_dir, bundle_name, playlist_info.title, saved_files,
-            source_url=args.url,
+            source_url=args.url, rescan=rescan,
         )
         print(f"\nCreated index: {index_path}")
         print(f"Bundle complete: {len(saved_files)} transcripts saved to {bundle_dir}/")
@@ -532,18 +733,6 @@ def build_batch_parser() -> argparse.ArgumentParser:
         required=True,
         help="Bundle name (required)",
     )
-    parser.add_argument(
-        "-o", "--output",
-        type=Path,
-        default=None,
-        help="Base output directory (default: ./transcripts/)",
-    )
-    parser.add_argument(
-        "-l", "--lang",
-        nargs="+",
-        default=None,
-        help="Preferred transcript language(s) (default: en)",
-    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -556,156 +745,236 @@ def build_batch_parser() -> argparse.ArgumentParser:
         dest="jsonl_output",
         help="Output one JSON object per line as each video completes (streaming-friendly)",
     )
-    parser.add_argument(
-        "-v", "--verbose",
-        action="store_true",
-        help="Enable verbose logging",
-    )
+    _add_bundle_fetch_args(parser)
     return parser
 
 
+# Flags understood by _parse_batch_args(), mapped to their argparse dest
+_BATCH_VALUE_FLAGS = {
+    "--bundle": "bundle",
+    "-o": "output",
+    "--output": "output",
+    "--from-file": "from_file",
+    "-j": "concurrency",
+    "--concurrency": "concurrency",
+}
+_BATCH_BOOL_FLAGS = {
+    "--json": "json_output",
+    "--jsonl": "jsonl_output",
+    "--no-cache": "no_cache",
+    "--refresh": "refresh",
+    "-v": "verbose",
+    "--verbose": "verbose",
+}
+
+
+def _parse_batch_args(argv: list[str]) -> argparse.Namespace | None:
+    """Parse well-formed batch arguments in a single pass, without argparse.
+
+    batch is the scripting entry point and may be spawned once per job, so
+    skip building the full ArgumentParser when the command line is plain.
+    Returns None for anything that needs argparse's handling (-h/--help,
+    unknown or abbreviated flags, missing values or --bundle), so usage
+    errors and help output are unchanged.
+    """
+    args = argparse.Namespace(
+        videos=[], from_file=None, bundle=None, output=None, lang=None,
+        json_output=False, jsonl_output=False, verbose=False,
+        concurrency=DEFAULT_CONCURRENCY, no_cache=False, refresh=False,
+    )
+    i, n = 0, len(argv)
+    while i < n:
+        tok = argv[i]
+        i += 1
+        if tok == "--":
+            args.videos.extend(argv[i:])
+            break
+        if not tok.startswith("-") or tok == "-":
+            args.videos.append(tok)
+            continue
+
+        flag, eq, value = tok.partition("=") if tok.startswith("--") else (tok, "", "")
+        if flag in _BATCH_BOOL_FLAGS and not eq:
+            setattr(args, _BATCH_BOOL_FLAGS[flag], True)
+        elif flag in _BATCH_VALUE_FLAGS:
+            if not eq:
+                if i >= n or argv[i].startswith("-"):
+                    return None
+                value = argv[i]
+                i += 1
+            dest = _BATCH_VALUE_FLAGS[flag]
+            if dest == "concurrency":
+                # isdecimal(), not isdigit(): int() rejects digits like "²"
+                if not value.isdecimal():
+                    return None
+                args.concurrency = int(value)
+            else:
+                setattr(args, dest, value if dest == "bundle" else Path(value))
+        elif flag in ("-l", "--lang") and not eq:
+            langs = []
+            while i < n and not argv[i].startswith("-"):
+                langs.append(argv[i])
+                i += 1
+            if not langs:
+                return None
+            args.lang = langs
+        else:
+            return None
+
+    if args.bundle is None:
+        return None
+    return args
+
+
+def _dedupe_videos(videos: list[str]) -> list[str]:
+    """Drop inputs that name a video already listed, keeping input order.
+
+    An ID and its URL, or the same ID given twice, would otherwise be
+    fetched by two workers writing the same file. Inputs that don't
+    parse are kept so the fetch loop reports them as skipped.
+    """
+    from .url_parser import extract_video_id
+
+    seen: set[str] = set()
+    unique = []
+    for video in videos:
+        try:
+            video_id = extract_video_id(video)
+        except ValueError:
+            unique.append(video)
+            continue
+        if video_id not in seen:
+            seen.add(video_id)
+            unique.append(video)
+    return unique
+
+
 def _jsonl_write(obj: dict) -> None:
-    """Write a JSON object as a single line to stdout, flush immediately."""
-    import json
-    sys.stdout.write(json.dumps(obj, ensure_ascii=False) + "\n")
-    sys.stdout.flush()
+    """Write a JSON object as a single line to stdout, flush immediately.
+
+    Goes through _write_stdout_bytes(), so piped output skips Python's
+    stream buffering.
+    """
+    _write_stdout_bytes(_json_bytes(obj) + b"\n")
 
 
 def batch_main(argv: list[str]) -> int:
     """Download transcripts for explicit video IDs as a bundle (fully non-interactive)."""
-    from .bundle import create_bundle_dir, generate_index
+    from .bundle import bundle_has_files, create_bundle_dir, generate_index
 
-    parser = build_batch_parser()
-    args = parser.parse_args(argv)
+    args = _parse_batch_args(argv)
+    if args is None:
+        args = build_batch_parser().parse_args(argv)
     config = load_config()
     apply_config_defaults(args, config)
 
-    level = logging.DEBUG if args.verbose else logging.WARNING
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s",
-        level=level,
-        stream=sys.stderr,
-    )
-
     # Merge positional videos with --from-file entries
     videos = list(args.videos or [])
     if args.from_file is not None:
         if not args.from_file.is_file():
             print(f"Error: File not found: {args.from_file}", file=sys.stderr)
             return 1
-        for line in args.from_file.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            videos.append(line)
+        # Stream the file and drop entries already listed, so a repeated
+        # ID is fetched (and its file written) only once
+        seen = set(videos)
+        with args.from_file.open("r", encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line or line.startswith("#") or line in seen:
+                    continue
+                seen.add(line)
+                videos.append(line)
 
     if not videos:
         print("Error: No videos specified. Provide video IDs/URLs as arguments or via --from-file.", file=sys.stderr)
         return 1
+    videos = _dedupe_videos(videos)
 
     quiet = args.json_output or args.jsonl_output
+    _init_logging(args.verbose, quiet=quiet)
 
     try:
         # 1. Create bundle directory
         bundle_dir = create_bundle_dir(args.bundle, output_base=args.output)
+        rescan = bundle_has_files(bundle_dir)
 
         # 2. Fetch transcripts for each video
         saved_files: list[tuple[str, str, Path]] = []
-        json_files: list[dict] = []
+        # Filled by input position for --json, whatever order fetches finish in
+        json_files: list[dict | None] = [None] * len(videos) if args.json_output else []
         total = len(videos)
 
         if args.jsonl_output:
             _jsonl_write({"event": "start", "total": total, "bundle": args.bundle})
+        elif not quiet:
+            print(f"Fetching {total} transcripts...")
 
-        for i, video_arg in enumerate(videos, 1):
-            try:
-                video_id = extract_video_id(video_arg)
-
-                if not quiet:
-                    print(f"Fetching {i}/{total}: {video_id}...")
-
-                meta = fetch_metadata(video_id, enrich=True)
-                transcript = fetch_transcript(video_id, languages=args.lang)
-
-                # Backfill duration
-                if meta.duration_seconds is None:
-                    meta.duration_seconds = transcript.duration_seconds
-
-                content = format_markdown(meta, transcript)
-                filename = generate_filename(meta) + ".md"
-                output_path = bundle_dir / filename
-
-                output_path.write_text(content, encoding="utf-8")
-
+        fetches = _run_fetch_loop(
+            videos, args.lang, bundle_dir,
+            _get_fetchers(not args.no_cache, args.refresh), concurrency=args.concurrency,
+        )
+        # Progress is reported in completion order; "index" counts completions
+        try:
+            for done, position, entry, error in fetches:
+                if error is not None:
+                    video_arg = videos[position]
+                    if not quiet:
+                        print(f"  [{done}/{total}] Warning: Skipped {video_arg} — {error}", file=sys.stderr)
+                    if args.json_output:
+                        json_files[position] = {
+                            "video_id": video_arg,
+                            "title": None,
+                            "path": None,
+                            "status": "skipped",
+                            "error": str(error),
+                        }
+                    if args.jsonl_output:
+                        _jsonl_write({
+                            "event": "progress",
+                            "index": done,
+                            "total": total,
+                            "video_id": video_arg,
+                            "title": None,
+                            "status": "skipped",
+                            "error": str(error),
+                        })
+                    continue
+
+                title, video_id, output_path = entry
                 if not quiet:
-                    print(f"  Saved: {output_path}")
+                    print(f"  [{done}/{total}] Saved: {output_path}")
 
-                saved_files.append((meta.title, meta.video_id, output_path))
-                json_files.append({
-                    "video_id": meta.video_id,
-                    "title": meta.title,
-                    "path": str(output_path),
-                    "status": "saved",
-                })
+                saved_files.append(entry)
+                if args.json_output:
+                    json_files[position] = {
+                        "video_id": video_id,
+                        "title": title,
+                        "path": str(output_path),
+                        "status": "saved",
+                    }
 
                 if args.jsonl_output:
                     _jsonl_write({
                         "event": "progress",
-                        "index": i,
+                        "index": done,
                         "total": total,
-                        "video_id": meta.video_id,
-                        "title": meta.title,
+                        "video_id": video_id,
+                        "title": title,
                         "status": "saved",
                         "path": str(output_path),
                     })
-
-            except (YtScribeError, ValueError) as e:
-                if not quiet:
-                    print(f"  Warning: Skipped {video_arg} — {e}", file=sys.stderr)
-                json_files.append({
-                    "video_id": video_arg,
-                    "title": None,
-                    "path": None,
-                    "status": "skipped",
-                    "error": str(e),
-                })
-                if args.jsonl_output:
-                    _jsonl_write({
-                        "event": "progress",
-                        "index": i,
-                        "total": total,
-                        "video_id": video_arg,
-                        "title": None,
-                        "status": "skipped",
-                        "error": str(e),
-                    })
-                continue
-            except Exception as e:
-                log.debug("Unexpected error for %s: %s", video_arg, e)
-                if not quiet:
-                    print(f"  Warning: Skipped {video_arg} — {e}", file=sys.stderr)
-                json_files.append({
-                    "video_id": video_arg,
-                    "title": None,
-                    "path": None,
-                    "status": "skipped",
-                    "error": str(e),
-                })
-                if args.jsonl_output:
-                    _jsonl_write({
-                        "event": "progress",
-                        "index": i,
-                        "total": total,
-                        "video_id": video_arg,
-                        "title": None,
-                        "status": "skipped",
-                        "error": str(e),
-                    })
-                continue
+        except KeyboardInterrupt:
+            # Index what already reached disk, so an interrupted run
+            # still leaves a usable bundle
+            if saved_files:
+                generate_index(bundle_dir, args.bundle, "batch import", saved_files, rescan=rescan)
+            raise
 
         # 3. Generate index (even if some failed, as long as we have at least one)
         if saved_files:
-            generate_index(bundle_dir, args.bundle, "batch import", saved_files)
+            generate_index(
+                bundle_dir, args.bundle, "batch import", saved_files, rescan=rescan,
+            )
 
         # 4. Output
         if args.jsonl_output:
@@ -719,7 +988,6 @@ def batch_main(argv: list[str]) -> int:
             return 0
 
         if args.json_output:
-            import json
             output = {
                 "bundle": args.bundle,
                 "bundle_dir": str(bundle_dir),
@@ -728,7 +996,7 @@ def batch_main(argv: list[str]) -> int:
                 "total_skipped": total - len(saved_files),
                 "files": json_files,
             }
-            sys.stdout.write(json.dumps(output, indent=2, ensure_ascii=False))
+            _write_json_stdout(output)
         else:
             if not saved_files:
                 print("\nNo transcripts were saved.", file=sys.stderr)
@@ -753,59 +1021,70 @@ def batch_main(argv: list[str]) -> int:
 # Main entry point
 # ---------------------------------------------------------------------------
 
+# Subcommand name -> entry point. Each one builds only its own parser.
+_SUBCOMMANDS = {
+    "search": search_main,
+    "playlist": playlist_main,
+    "batch": batch_main,
+}
+
+
 def main(argv: list[str] | None = None) -> int:
     if argv is None:
         argv = sys.argv[1:]
 
-    # Route to search if first arg is "search"
-    if argv and argv[0] == "search":
-        return search_main(argv[1:])
-    if argv and argv[0] == "playlist":
-        return playlist_main(argv[1:])
-    if argv and argv[0] == "batch":
-        return batch_main(argv[1:])
+    # Route to a subcommand before building the default parser
+    if argv and argv[0] in _SUBCOMMANDS:
+        return _SUBCOMMANDS[argv[0]](argv[1:])
 
-    # Existing fetch logic (unchanged)
+    # Single-video fetch
     parser = build_parser()
     args = parser.parse_args(argv)
     config = load_config()
     apply_config_defaults(args, config)
 
-    level = logging.DEBUG if args.verbose else logging.WARNING
-    logging.basicConfig(
-        format="%(levelname)s: %(message)s",
-        level=level,
-        stream=sys.stderr,
-    )
+    from .url_parser import extract_video_id
+    from .formatter import iter_markdown, iter_json_bytes, generate_filename
+
+    fetch_metadata, fetch_transcript = _get_fetchers(not args.no_cache, args.refresh)
+
+    _init_logging(args.verbose, quiet=args.json_output and args.stdout)
 
     try:
         # 1. Parse video ID
         video_id = extract_video_id(args.video)
         log.debug("Video ID: %s", video_id)
 
-        # 2. Fetch metadata
-        meta = fetch_metadata(video_id, enrich=args.enrich)
-        log.debug("Title: %s", meta.title)
-
-        # 3. Fetch transcript
-        transcript = fetch_transcript(video_id, languages=args.lang)
+        # 2-3. Fetch metadata and transcript at the same time; they are
+        #      independent requests, so wait for the slower one, not both.
+        #      Metadata errors are still reported first.
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            transcript_future = executor.submit(fetch_transcript, video_id, languages=args.lang)
+            meta = fetch_metadata(video_id, enrich=args.enrich)
+            log.debug("Title: %s", meta.title)
+            transcript = transcript_future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
         log.debug("Got %d segments in %s", len(transcript.segments), transcript.language)
 
         # 4. Backfill duration from transcript if oEmbed didn't provide it
         if meta.duration_seconds is None:
             meta.duration_seconds = transcript.duration_seconds
 
-        # 5. Format output
+        # 5. Format output lazily as UTF-8 chunks; JSON is encoded
+        #    straight to bytes, Markdown in batches
         if args.json_output:
-            content = format_json(meta, transcript)
+            chunks = iter_json_bytes(meta, transcript)
             ext = ".json"
         else:
-            content = format_markdown(meta, transcript)
+            chunks = _encode_batches(iter_markdown(meta, transcript))
             ext = ".md"
 
         # 6. Write output
         if args.stdout:
-            sys.stdout.write(content)
+            for data in chunks:
+                _write_stdout_bytes(data)
             return 0
 
         output_dir = args.output or Path("transcripts")
@@ -814,7 +1093,7 @@ def main(argv: list[str] | None = None) -> int:
         filename = generate_filename(meta) + ext
         output_path = output_dir / filename
 
-        output_path.write_text(content, encoding="utf-8")
+        _write_chunks(output_path, chunks)
         print(f"Saved: {output_path}")
         return 0
 
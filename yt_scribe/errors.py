@@ -15,3 +15,7 @@ class TranscriptNotAvailableError(YtScribeError):
 
 class MetadataFetchError(YtScribeError):
     """Failed to fetch video metadata."""
+
+
+class BundleWriteError(YtScribeError):
+    """Bundle directory cannot be created or written to."""
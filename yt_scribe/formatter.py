@@ -2,11 +2,21 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 
 from .metadata import VideoMetadata
 from .transcript import TranscriptResult
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+# Zero-padded "00".."59", indexed instead of formatted with :02d
+_PAD2 = tuple(f"{i:02d}" for i in range(60))
+
 
 def _format_timestamp(seconds: float) -> str:
     """Convert seconds to HH:MM:SS or MM:SS format."""
@@ -14,8 +24,29 @@ def _format_timestamp(seconds: float) -> str:
     hours, remainder = divmod(total, 3600)
     minutes, secs = divmod(remainder, 60)
     if hours > 0:
-        return f"{hours}:{minutes:02d}:{secs:02d}"
-    return f"{minutes}:{secs:02d}"
+        return f"{hours}:{_PAD2[minutes]}:{_PAD2[secs]}"
+    return f"{minutes}:{_PAD2[secs]}"
+
+
+def _format_timestamps(starts: Iterable[float]) -> list[str]:
+    """Format many segment start times at once; same output as _format_timestamp.
+
+    Transcripts run to thousands of segments, so this does the arithmetic
+    inline and looks padded fields up in _PAD2 instead of calling the
+    scalar helper and formatting each field per segment.
+    """
+    pad2 = _PAD2
+    out = []
+    append = out.append
+    for seconds in starts:
+        total = int(seconds)
+        hours = total // 3600
+        minutes = total // 60 % 60
+        if hours > 0:
+            append(f"{hours}:{pad2[minutes]}:{pad2[total % 60]}")
+        else:
+            append(f"{minutes}:{pad2[total % 60]}")
+    return out
 
 
 def _format_duration(seconds: int) -> str:
@@ -31,64 +62,92 @@ def _format_duration(seconds: int) -> str:
     return " ".join(parts)
 
 
+def iter_markdown(
+    meta: VideoMetadata,
+    transcript: TranscriptResult,
+    fetched_at: datetime | None = None,
+) -> Iterator[str]:
+    """Yield the Markdown document in chunks: header, then one per segment.
+
+    Lets callers stream a long transcript to a file without building the
+    whole document first. Joined, the chunks equal format_markdown().
+    *fetched_at* defaults to now; bulk commands pass one time for the run.
+    """
+    if fetched_at is None:
+        fetched_at = datetime.now(timezone.utc)
+    duration = meta.duration_seconds or transcript.duration_seconds
+    duration_text = _format_duration(duration) if duration else ""
+    kind = "auto-generated" if transcript.is_generated else "manual"
+    duration_field = f'duration: "{duration_text}"\n' if duration else ""
+    duration_line = f"**Duration:** {duration_text}\n" if duration else ""
+    upload_field = f'upload_date: "{meta.upload_date}"\n' if meta.upload_date else ""
+    upload_line = f"**Uploaded:** {meta.upload_date}\n" if meta.upload_date else ""
+
+    # Frontmatter, heading and transcript title as one template
+    yield (
+        f"---\n"
+        f'title: "{meta.title}"\n'
+        f'channel: "{meta.channel}"\n'
+        f'video_id: "{meta.video_id}"\n'
+        f'url: "https://www.youtube.com/watch?v={meta.video_id}"\n'
+        f"{duration_field}"
+        f"{upload_field}"
+        f'language: "{transcript.language}"\n'
+        f'transcript_type: "{kind}"\n'
+        f'fetched_at: "{fetched_at:%Y-%m-%d %H:%M:%S UTC}"\n'
+        f"---\n"
+        f"\n"
+        f"# {meta.title}\n"
+        f"\n"
+        f"**Channel:** [{meta.channel}]({meta.channel_url})\n"
+        f"{duration_line}"
+        f"{upload_line}"
+        f"**Language:** {transcript.language} ({kind})\n"
+        f"\n"
+        f"---\n"
+        f"\n"
+        f"## Transcript\n"
+    )
+    segments = transcript.segments
+    timestamps = _format_timestamps([segment.start for segment in segments])
+    for ts, segment in zip(timestamps, segments):
+        yield f"\n**[{ts}]** {segment.text}\n"
+
+
 def format_markdown(
     meta: VideoMetadata,
     transcript: TranscriptResult,
+    fetched_at: datetime | None = None,
 ) -> str:
     """Format video metadata + transcript as Markdown."""
-    lines: list[str] = []
+    return "".join(iter_markdown(meta, transcript, fetched_at))
 
-    duration = meta.duration_seconds or transcript.duration_seconds
 
-    # YAML frontmatter
-    lines.append("---")
-    lines.append(f'title: "{meta.title}"')
-    lines.append(f'channel: "{meta.channel}"')
-    lines.append(f'video_id: "{meta.video_id}"')
-    lines.append(f'url: "https://www.youtube.com/watch?v={meta.video_id}"')
-    if duration:
-        lines.append(f'duration: "{_format_duration(duration)}"')
-    if meta.upload_date:
-        lines.append(f'upload_date: "{meta.upload_date}"')
-    lines.append(f'language: "{transcript.language}"')
-    lines.append(f'transcript_type: "{"auto-generated" if transcript.is_generated else "manual"}"')
-    lines.append(f'fetched_at: "{datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")}"')
-    lines.append("---")
-    lines.append("")
-
-    # Heading
-    lines.append(f"# {meta.title}")
-    lines.append("")
-    lines.append(f"**Channel:** [{meta.channel}]({meta.channel_url})")
-    if duration:
-        lines.append(f"**Duration:** {_format_duration(duration)}")
-    if meta.upload_date:
-        lines.append(f"**Uploaded:** {meta.upload_date}")
-    lines.append(
-        f"**Language:** {transcript.language}"
-        f" ({'auto-generated' if transcript.is_generated else 'manual'})"
-    )
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+_JSON_BATCH_SEGMENTS = 1024
 
-    # Transcript body
-    lines.append("## Transcript")
-    lines.append("")
-    for segment in transcript.segments:
-        ts = _format_timestamp(segment.start)
-        lines.append(f"**[{ts}]** {segment.text}")
-        lines.append("")
 
-    return "\n".join(lines)
+def _dumps_indented(obj: object) -> bytes:
+    """Serialize *obj* as 2-space indented UTF-8 JSON, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
 
 
-def format_json(
+def iter_json_bytes(
     meta: VideoMetadata,
     transcript: TranscriptResult,
-) -> str:
-    """Format video metadata + transcript as JSON."""
-    data = {
+    fetched_at: datetime | None = None,
+) -> Iterator[bytes]:
+    """Yield the JSON document as UTF-8 chunks, segments in batches.
+
+    The JSON counterpart of iter_markdown(): the header and each batch of
+    _JSON_BATCH_SEGMENTS segments are serialized separately, so a long
+    transcript never exists as one dict or one bytes object. Joined, the
+    chunks equal format_json_bytes(). *fetched_at* defaults to now.
+    """
+    if fetched_at is None:
+        fetched_at = datetime.now(timezone.utc)
+    header = _dumps_indented({
         "video_id": meta.video_id,
         "title": meta.title,
         "channel": meta.channel,
@@ -100,18 +159,64 @@ def format_json(
         "language": transcript.language,
         "language_code": transcript.language_code,
         "is_generated": transcript.is_generated,
-        "fetched_at": datetime.now(timezone.utc).isoformat(),
-        "segments": [
+        "fetched_at": fetched_at.isoformat(),
+    })
+    segments = transcript.segments
+    if not segments:
+        yield header[:-2] + b',\n  "segments": []\n}'
+        return
+
+    # Drop the header's closing "\n}" and open the segments array.
+    yield header[:-2] + b',\n  "segments": [\n'
+    timestamps = _format_timestamps([seg.start for seg in segments])
+    for i in range(0, len(segments), _JSON_BATCH_SEGMENTS):
+        batch = _dumps_indented([
             {
                 "text": seg.text,
                 "start": round(seg.start, 2),
                 "duration": round(seg.duration, 2),
-                "timestamp": _format_timestamp(seg.start),
+                "timestamp": ts,
             }
-            for seg in transcript.segments
-        ],
-    }
-    return json.dumps(data, indent=2, ensure_ascii=False)
+            for seg, ts in zip(
+                segments[i:i + _JSON_BATCH_SEGMENTS],
+                timestamps[i:i + _JSON_BATCH_SEGMENTS],
+            )
+        ])
+        # Strip the batch's own "[\n" and "\n]" and indent it one level;
+        # raw newlines only appear between tokens, never inside strings.
+        body = b"  " + batch[2:-2].replace(b"\n", b"\n  ")
+        yield body if i == 0 else b",\n" + body
+    yield b"\n  ]\n}"
+
+
+def format_json_bytes(
+    meta: VideoMetadata,
+    transcript: TranscriptResult,
+    fetched_at: datetime | None = None,
+) -> bytes:
+    """Format video metadata + transcript as UTF-8 encoded JSON.
+
+    Uses orjson when it is installed; long transcripts encode several
+    times faster than with the json module. *fetched_at* defaults to now.
+    """
+    return b"".join(iter_json_bytes(meta, transcript, fetched_at))
+
+
+def format_json(
+    meta: VideoMetadata,
+    transcript: TranscriptResult,
+    fetched_at: datetime | None = None,
+) -> str:
+    """Format video metadata + transcript as JSON."""
+    return format_json_bytes(meta, transcript, fetched_at).decode("utf-8")
+
+
+# ASCII fast path for generate_filename(): same rule as the per-character
+# loop (keep alphanumerics, spaces and hyphens), as a bytes.translate table
+_FILENAME_TABLE = bytes(
+    c if c < 128 and (chr(c).isalnum() or chr(c) in " -") else ord("_")
+    for c in range(256)
+)
 
 
 def generate_filename(meta: VideoMetadata) -> str:
@@ -119,10 +224,14 @@ def generate_filename(meta: VideoMetadata) -> str:
 
     Format: {sanitized_title}_{video_id}
     """
-    safe = "".join(
-        c if c.isalnum() or c in " -" else "_"
-        for c in meta.title
-    )
+    title = meta.title
+    if title.isascii():
+        safe = title.encode("ascii").translate(_FILENAME_TABLE).decode("ascii")
+    else:
+        safe = "".join(
+            c if c.isalnum() or c in " -" else "_"
+            for c in title
+        )
     # Collapse multiple underscores/spaces, strip, truncate
     safe = "_".join(safe.split())[:80]
     return f"{safe}_{meta.video_id}"
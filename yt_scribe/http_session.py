@@ -0,0 +1,29 @@
+"""Shared HTTP session for YouTube requests.
+
+oEmbed metadata and transcript requests all go to www.youtube.com. Reusing
+one requests.Session keeps the connection alive between them, so only
+the first request of a run pays for the TCP and TLS handshake.
+
+youtube-transcript-api documents its Session use as not thread-safe, and
+bulk commands fetch on worker threads, so each thread gets its own
+session and reuses it for every video it handles.
+"""
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+_local = threading.local()
+
+
+def get_session() -> requests.Session:
+    """Return this thread's requests.Session, creating it on first use."""
+    session = getattr(_local, "session", None)
+    if session is None:
+        import requests
+
+        session = _local.session = requests.Session()
+    return session
@@ -8,16 +8,16 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 
-import requests
-
 from .errors import MetadataFetchError
+from .http_session import get_session
+from .ytdlp import YDL_OPTS, get_ydl
 
 log = logging.getLogger(__name__)
 
 OEMBED_URL = "https://www.youtube.com/oembed"
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoMetadata:
     """Structured video metadata."""
     video_id: str
@@ -37,9 +37,11 @@ def fetch_metadata_oembed(video_id: str) -> VideoMetadata:
     Returns title, channel name, channel URL, thumbnail URL.
     Does NOT return duration or upload date.
     """
+    import requests
+
     url = f"https://www.youtube.com/watch?v={video_id}"
     try:
-        resp = requests.get(
+        resp = get_session().get(
             OEMBED_URL,
             params={"url": url, "format": "json"},
             timeout=10,
@@ -64,23 +66,9 @@ def fetch_metadata_ytdlp(video_id: str) -> VideoMetadata:
 
     Returns everything oEmbed does PLUS: duration, upload_date, description.
     """
-    try:
-        import yt_dlp
-    except ImportError:
-        raise MetadataFetchError(
-            "yt-dlp is not installed. Install with: pip install yt-dlp"
-        )
-
-    opts = {
-        "quiet": True,
-        "no_warnings": True,
-        "skip_download": True,
-        "no_color": True,
-    }
     url = f"https://www.youtube.com/watch?v={video_id}"
     try:
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+        info = get_ydl(YDL_OPTS).extract_info(url, download=False)
     except Exception as e:
         raise MetadataFetchError(f"yt-dlp extraction failed: {e}") from e
 
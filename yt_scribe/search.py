@@ -5,11 +5,12 @@ import logging
 from dataclasses import dataclass
 
 from .errors import MetadataFetchError
+from .ytdlp import YDL_OPTS_FLAT, get_ydl
 
 log = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     video_id: str
     title: str
@@ -30,26 +31,10 @@ def search_youtube(query: str, max_results: int = 10) -> list[SearchResult]:
 
     Raises MetadataFetchError if yt-dlp is not installed or search fails.
     """
-    try:
-        import yt_dlp
-    except ImportError:
-        raise MetadataFetchError(
-            "yt-dlp is not installed. Install with: pip install yt-dlp"
-        )
-
-    opts = {
-        "quiet": True,
-        "no_warnings": True,
-        "skip_download": True,
-        "extract_flat": True,
-        "no_color": True,
-    }
-
     search_query = f"ytsearch{max_results}:{query}"
 
     try:
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(search_query, download=False)
+        info = get_ydl(YDL_OPTS_FLAT).extract_info(search_query, download=False)
     except Exception as e:
         raise MetadataFetchError(f"YouTube search failed: {e}") from e
 
@@ -79,7 +64,7 @@ def search_youtube(query: str, max_results: int = 10) -> list[SearchResult]:
     return results
 
 
-@dataclass
+@dataclass(slots=True)
 class PlaylistInfo:
     title: str
     playlist_url: str
@@ -96,23 +81,7 @@ def fetch_playlist(playlist_url: str) -> PlaylistInfo:
     Raises MetadataFetchError if yt-dlp fails or playlist is empty/private.
     """
     try:
-        import yt_dlp
-    except ImportError:
-        raise MetadataFetchError(
-            "yt-dlp is not installed. Install with: pip install yt-dlp"
-        )
-
-    opts = {
-        "quiet": True,
-        "no_warnings": True,
-        "skip_download": True,
-        "extract_flat": True,
-        "no_color": True,
-    }
-
-    try:
-        with yt_dlp.YoutubeDL(opts) as ydl:
-            info = ydl.extract_info(playlist_url, download=False)
+        info = get_ydl(YDL_OPTS_FLAT).extract_info(playlist_url, download=False)
     except Exception as e:
         raise MetadataFetchError(f"Playlist fetch failed: {e}") from e
 
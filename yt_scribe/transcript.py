@@ -5,19 +5,13 @@ import html
 import logging
 from dataclasses import dataclass
 
-from youtube_transcript_api import (
-    YouTubeTranscriptApi,
-    NoTranscriptFound,
-    TranscriptsDisabled,
-    VideoUnavailable,
-)
-
 from .errors import TranscriptNotAvailableError, VideoNotFoundError
+from .http_session import get_session
 
 log = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptSegment:
     """A single transcript segment with timestamp."""
     text: str
@@ -25,7 +19,7 @@ class TranscriptSegment:
     duration: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptResult:
     """Complete transcript result."""
     video_id: str
@@ -62,10 +56,19 @@ def fetch_transcript(
     Returns:
         TranscriptResult with segments and metadata.
     """
+    # Imported here: youtube-transcript-api takes ~75 ms to import, and
+    # cached runs and the data classes above don't need it.
+    from youtube_transcript_api import (
+        YouTubeTranscriptApi,
+        NoTranscriptFound,
+        TranscriptsDisabled,
+        VideoUnavailable,
+    )
+
     if languages is None:
         languages = ["en"]
 
-    ytt_api = YouTubeTranscriptApi()
+    ytt_api = YouTubeTranscriptApi(http_client=get_session())
 
     try:
         transcript_list = ytt_api.list(video_id)
@@ -102,9 +105,11 @@ def fetch_transcript(
 
     fetched = transcript.fetch()
 
+    # Most snippets contain no entities; skip the unescape call for those
+    unescape = html.unescape
     segments = [
         TranscriptSegment(
-            text=html.unescape(snippet.text),
+            text=unescape(text) if "&" in (text := snippet.text) else text,
             start=snippet.start,
             duration=snippet.duration,
         )
@@ -10,6 +10,20 @@ VIDEO_ID_RE = re.compile(r"^[a-zA-Z0-9_-]{11}$")
 # Patterns for path-based IDs: /embed/ID, /shorts/ID, /live/ID, /v/ID
 PATH_PATTERNS = re.compile(r"^/(?:embed|shorts|live|v)/([a-zA-Z0-9_-]{11})")
 
+# One anchored scan for the common inputs: a raw ID, or a canonical
+# watch/youtu.be/embed/shorts/live/v URL. The lookaheads require the ID to
+# end the query value or path, as urlparse()/parse_qs would see it.
+# Everything else falls through to urlparse().
+FAST_ID_RE = re.compile(
+    r"(?:"
+    r"https?://(?:www\.|m\.)?youtube\.com/"
+    r"(?:watch\?v=([a-zA-Z0-9_-]{11})(?=[&#]|\Z)"
+    r"|(?:embed|shorts|live|v)/([a-zA-Z0-9_-]{11}))"
+    r"|https?://youtu\.be/([a-zA-Z0-9_-]{11})(?=[?#]|\Z)"
+    r"|([a-zA-Z0-9_-]{11})\Z"
+    r")"
+)
+
 
 def extract_video_id(url_or_id: str) -> str:
     """Extract YouTube video ID from URL or raw ID string.
@@ -18,9 +32,10 @@ def extract_video_id(url_or_id: str) -> str:
     """
     url_or_id = url_or_id.strip()
 
-    # Direct video ID (11 chars)
-    if VIDEO_ID_RE.match(url_or_id):
-        return url_or_id
+    # Raw ID or canonical URL: a single regex match, no URL parsing
+    match = FAST_ID_RE.match(url_or_id)
+    if match:
+        return match[match.lastindex]
 
     parsed = urlparse(url_or_id)
 
@@ -0,0 +1,82 @@
+"""Shared yt-dlp instances.
+
+Creating a YoutubeDL loads the extractor list and sets up cookie and
+network handling, which costs tens of milliseconds. Search, playlist and
+enriched metadata lookups reuse one instance per set of options instead
+of building a fresh one for every call.
+
+YoutubeDL is not thread-safe and bulk commands fetch on worker threads,
+so, as with http_session, each thread keeps its own instances. They
+are closed when their thread ends, or at interpreter exit for threads
+still running, so a long-lived process that keeps starting new worker
+pools does not pile up open instances.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+import weakref
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+from .errors import MetadataFetchError
+
+log = logging.getLogger(__name__)
+
+# Options for single-video lookups, and for search and playlist listings,
+# which only need the flat entries rather than each video's full info.
+YDL_OPTS: Mapping[str, Any] = MappingProxyType({
+    "quiet": True,
+    "no_warnings": True,
+    "skip_download": True,
+    "no_color": True,
+})
+YDL_OPTS_FLAT: Mapping[str, Any] = MappingProxyType({**YDL_OPTS, "extract_flat": True})
+
+_local = threading.local()
+
+
+class _ThreadInstances:
+    """Holds one thread's YoutubeDL instances, keyed by class and options.
+
+    Only the thread-local storage refers to it, so it is collected when
+    the thread ends, and a weakref.finalize closes the instances.
+    """
+
+    __slots__ = ("instances", "__weakref__")
+
+    def __init__(self) -> None:
+        self.instances: dict[tuple, Any] = {}
+        weakref.finalize(self, _close_all, self.instances)
+
+
+def get_ydl(opts: Mapping[str, Any]) -> Any:
+    """Return this thread's YoutubeDL for *opts*, creating it on first use.
+
+    Raises MetadataFetchError if yt-dlp is not installed.
+    """
+    try:
+        import yt_dlp
+    except ImportError:
+        raise MetadataFetchError(
+            "yt-dlp is not installed. Install with: pip install yt-dlp"
+        )
+
+    holder = getattr(_local, "holder", None)
+    if holder is None:
+        holder = _local.holder = _ThreadInstances()
+    instances = holder.instances
+    key = (yt_dlp.YoutubeDL, frozenset(opts.items()))
+    ydl = instances.get(key)
+    if ydl is None:
+        ydl = instances[key] = yt_dlp.YoutubeDL(dict(opts))
+    return ydl
+
+
+def _close_all(instances: dict[tuple, Any]) -> None:
+    for ydl in instances.values():
+        try:
+            ydl.close()
+        except Exception as e:
+            log.debug("Error closing YoutubeDL instance: %s", e)